@@ -6,12 +6,24 @@ Handles bot initialization, event handling, and command registration
 import discord
 from discord.ext import commands
 import asyncio
+import contextlib
 import logging
+import os
+import time
 from typing import Optional
-from ..game import PlayerCreation, RegionManager, data_loader
-from ..game.enums import PlayerClass
+from ..game import PlayerCreation, RegionManager, data_loader, Enemy
+from ..game.enums import PlayerClass, EnemyType, EnemyBehavior
 # EmojiManager removed - using direct emoji properties now
 
+_ENEMY_TYPE_MAP = {
+    "normal": EnemyType.NORMAL,
+    "mini_boss": EnemyType.MINIBOSS,
+    "boss": EnemyType.BOSS,
+}
+
+# Waiting longer than this for an interaction slot gets logged as a sign of overload
+_SLOT_WAIT_WARNING_SECONDS = 0.5
+
 
 class PocketRPG(commands.Bot):
     """
@@ -37,6 +49,14 @@ class PocketRPG(commands.Bot):
         self.region_manager = RegionManager()
         self.active_players = {}  # user_id -> Player
         self.active_combats = {}  # channel_id -> Combat
+        self.enemy_prototypes = {}  # enemy_id -> Enemy template, cloned per encounter
+        self.activity_energy_costs = {}  # activity_id -> energy needed to start it
+        self.busy_users = set()  # user_ids with a command still in progress
+        self.pending_creations = set()  # user_ids with a character creation modal open
+        
+        # Caps how many deferred game handlers run at once under load
+        max_concurrent = int(os.getenv('MAX_CONCURRENT_INTERACTIONS', '64'))
+        self.interaction_slots = asyncio.Semaphore(max_concurrent)
         
         # Bot configuration
         self.logger = logging.getLogger('PocketRPG')
@@ -45,6 +65,9 @@ class PocketRPG(commands.Bot):
         """Called when the bot is starting up"""
         self.logger.info("Setting up PocketRPG bot...")
         
+        # Preload game data so command handlers never touch the filesystem
+        await self.preload_game_data()
+        
         # Load all cogs (command modules)
         await self.load_cogs()
         
@@ -65,6 +88,26 @@ class PocketRPG(commands.Bot):
         except Exception as e:
             self.logger.error(f"Failed to sync commands: {e}")
     
+    async def preload_game_data(self):
+        """Load all region, activity, item, and enemy data into the data loader cache"""
+        loader = self.region_manager.data_loader
+        # Read the files off the event loop so a reload never stalls the gateway
+        await asyncio.to_thread(loader.reload_data)
+        self.region_manager.clear_region_cache()
+        self.build_enemy_prototypes()
+        
+        activities = loader.get_loaded('activities')
+        self.activity_energy_costs = {
+            activity_id: activity_data.get('energy_cost', 0)
+            for activity_id, activity_data in activities.items()
+        }
+        self.logger.info(
+            f"Preloaded game data: {len(loader.get_loaded('regions'))} regions, "
+            f"{len(activities)} activities, "
+            f"{len(loader.get_loaded('items'))} items, "
+            f"{len(self.enemy_prototypes)} enemies"
+        )
+    
     async def load_cogs(self):
         """Load all command cogs"""
         cogs = [
@@ -137,6 +180,66 @@ class PocketRPG(commands.Bot):
         if user_id in self.active_players:
             del self.active_players[user_id]
     
+    def begin_user_action(self, user_id: int) -> bool:
+        """Mark a user as busy, return False if they already have a command in progress"""
+        if user_id in self.busy_users:
+            return False
+        self.busy_users.add(user_id)
+        return True
+    
+    def end_user_action(self, user_id: int):
+        """Mark a user's in-progress command as finished"""
+        self.busy_users.discard(user_id)
+    
+    @contextlib.asynccontextmanager
+    async def interaction_slot(self):
+        """Hold one of the bot-wide interaction slots, logging waits that took too long"""
+        started = time.monotonic()
+        async with self.interaction_slots:
+            waited = time.monotonic() - started
+            if waited > _SLOT_WAIT_WARNING_SECONDS:
+                self.logger.warning(f"Waited {waited * 1000:.0f}ms for an interaction slot")
+            yield
+    
+    def build_enemy_prototypes(self):
+        """Build a template Enemy for every enemy in the data loader cache"""
+        enemies = self.region_manager.data_loader.get_loaded('enemies')
+        self.enemy_prototypes = {
+            enemy_id: self._create_enemy_prototype(enemy_data)
+            for enemy_id, enemy_data in enemies.items()
+        }
+    
+    def _create_enemy_prototype(self, enemy_data) -> Enemy:
+        """Create an Enemy with its loot table from raw enemy data"""
+        enemy = Enemy(
+            name=enemy_data["name"],
+            enemy_type=_ENEMY_TYPE_MAP.get(enemy_data.get("type", "normal"), EnemyType.NORMAL),
+            level=enemy_data["base_level"],
+            behavior=EnemyBehavior.AGGRESSIVE,
+            emoji=enemy_data.get("emoji", "👹"),
+        )
+        
+        for loot_entry in enemy_data.get("loot_table", []):
+            enemy.add_loot_item(
+                item_name=loot_entry["item"],
+                drop_chance=loot_entry["drop_chance"],
+                quantity=(
+                    loot_entry["quantity"][0]
+                    if isinstance(loot_entry["quantity"], list)
+                    else loot_entry["quantity"]
+                ),
+            )
+        
+        return enemy
+    
+    def spawn_enemy(self, enemy_id: str, enemy_data) -> Enemy:
+        """Get a fresh Enemy instance for an encounter, cloned from its prototype"""
+        prototype = self.enemy_prototypes.get(enemy_id)
+        if prototype is None:
+            prototype = self._create_enemy_prototype(enemy_data)
+            self.enemy_prototypes[enemy_id] = prototype
+        return prototype.clone()
+    
     def get_combat(self, channel_id: int):
         """Get active combat in a channel"""
         return self.active_combats.get(channel_id)
@@ -80,7 +80,7 @@ class AdminCog(commands.Cog):
         
         try:
             # Reload data
-            self.bot.region_manager.data_loader.reload_data()
+            await self.bot.preload_game_data()
             
             embed = discord.Embed(
                 title="🔄 Data Reloaded",
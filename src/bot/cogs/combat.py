@@ -7,11 +7,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from ...game import Combat, data_loader
-from ...game.enums import StatType
+from ...game.enums import StatType, ItemType, ItemRarity, ItemQuality
+from ...game.items.item import ConsumableItem, WeaponItem, ArmorItem, EquipmentItem
 # UIEmojis no longer needed - using Emojis constants
-from ..utils import Emojis
-
+from ..utils import Emojis, EmbedUtils
 
+# Stats shown in the HP fields under every combat update
+_PLAYER_HEALTH_STATS = (StatType.HEALTH, StatType.MAX_HEALTH, StatType.ENERGY, StatType.MAX_ENERGY)
+_ENEMY_HEALTH_STATS = (StatType.HEALTH, StatType.MAX_HEALTH)
 
 
 class CombatView(discord.ui.View):
@@ -33,17 +36,19 @@ class CombatView(discord.ui.View):
 
     def _append_health_fields(self, embed: discord.Embed) -> None:
         """Append single set of player/enemy HP fields with bars to the embed."""
-        player_hp = self.player.get_stat(StatType.HEALTH)
-        player_hp_max = self.player.get_stat(StatType.MAX_HEALTH)
-        enemy_hp = self.enemy.get_stat(StatType.HEALTH)
-        enemy_hp_max = self.enemy.get_stat(StatType.MAX_HEALTH)
+        player_stats = self.player.get_stats(_PLAYER_HEALTH_STATS)
+        player_hp = player_stats[StatType.HEALTH]
+        player_hp_max = player_stats[StatType.MAX_HEALTH]
+        enemy_stats = self.enemy.get_stats(_ENEMY_HEALTH_STATS)
+        enemy_hp = enemy_stats[StatType.HEALTH]
+        enemy_hp_max = enemy_stats[StatType.MAX_HEALTH]
 
         player_bar = self._health_bar(player_hp, player_hp_max)
         enemy_bar = self._health_bar(enemy_hp, enemy_hp_max)
 
         embed.add_field(
             name=f"👤 {self.player.name} HP",
-            value=f"{player_hp}/{player_hp_max} {player_bar}\nEN: {self.player.get_stat(StatType.ENERGY)}/{self.player.get_stat(StatType.MAX_ENERGY)}",
+            value=f"{player_hp}/{player_hp_max} {player_bar}\nEN: {player_stats[StatType.ENERGY]}/{player_stats[StatType.MAX_ENERGY]}",
             inline=True
         )
         enemy_emoji = self.enemy.emoji if self.enemy_id else "👹"
@@ -114,7 +119,7 @@ class CombatView(discord.ui.View):
             
             # Generate and give loot drops
             loot_drops = self.enemy.generate_loot()
-            loot_text = ""
+            loot_lines = []
             
             if loot_drops:
                 for loot in loot_drops:
@@ -125,9 +130,6 @@ class CombatView(discord.ui.View):
                     item_data = self.bot.region_manager.data_loader.load_item(item_id)
                     if item_data:
                         # Create item instance using the proper item creation method
-                        from ...game.items.item import ConsumableItem, WeaponItem, ArmorItem, EquipmentItem
-                        from ...game.enums import ItemType, ItemRarity, ItemQuality
-                        
                         item_type = ItemType(item_data['type'])
                         item_rarity = ItemRarity(item_data['rarity'])
                         item_quality = ItemQuality(item_data['quality'])
@@ -179,12 +181,13 @@ class CombatView(discord.ui.View):
                         self.player.inventory.add_item(item, quantity)
                         
                         # Add to loot display
-                        loot_text += f"• **{item.name}** x{quantity}\n"
+                        loot_lines.append(f"• **{item.name}** x{quantity}")
             
             # Create rewards text
             rewards_text = f"**Experience:** +{exp_reward}\n**Gold:** +{gold_reward}"
-            if loot_text:
-                rewards_text += f"\n\n**Loot Drops:**\n{loot_text.strip()}"
+            if loot_lines:
+                loot_text = "\n".join(loot_lines)
+                rewards_text += f"\n\n**Loot Drops:**\n{loot_text}"
             
             embed.add_field(
                 name="🎁 Rewards",
@@ -195,9 +198,9 @@ class CombatView(discord.ui.View):
             # End combat
             self.bot.remove_combat(interaction.channel_id)
             
-            # Add continue button
+            # Add continue button (imported here: player -> game -> combat would cycle at module level)
             from .player import CharacterActionView
-            view = CharacterActionView(self.player, self.bot, show_enemies=True)
+            view = CharacterActionView.for_message(self.bot)
             
             embed.set_footer(text="Combat ended! Choose your next action.")
         else:
@@ -337,7 +340,6 @@ class CombatView(discord.ui.View):
         
         # Set enemy emoji as thumbnail
         if hasattr(self.enemy, 'emoji') and self.enemy.emoji:
-            from ..utils import EmbedUtils
             emoji_url = EmbedUtils.emoji_to_url(self.enemy.emoji)
             if emoji_url:
                 embed.set_thumbnail(url=emoji_url)
@@ -15,6 +15,19 @@ from ...game.enums import ItemRarity, ItemQuality, StatType
 from ..utils import Emojis
 
 
+# Item rarity lookup by the lowercase value used in the data files
+_RARITY_MAP = {rarity.value: rarity for rarity in ItemRarity}
+
+# Grid descriptions indexed by foraging level - 1
+_GRID_DESCRIPTIONS = (
+    "**Grid:** 1×3 | **Items:** 1 | **Tries:** 2",
+    "**Grid:** 2×3 | **Items:** 2 | **Tries:** 3",
+    "**Grid:** 3×3 | **Items:** 3 | **Tries:** 4",
+    "**Grid:** 4×4 | **Items:** 4 | **Tries:** 5",
+    "**Grid:** 5×5 | **Items:** 5 | **Tries:** 6",
+)
+
+
 class ForagingButton(discord.ui.Button):
     """Individual button in the foraging grid"""
     
@@ -67,6 +80,10 @@ class ForagingMinigameView(discord.ui.View):
         self.collected_items: List[ConsumableItem] = []
         self.game_over = False
         
+        # Found items text, rebuilt only when a new item is found
+        self._found_text = "None yet"
+        self._found_text_count = 0
+        
         # Create the button grid
         self._create_button_grid()
         
@@ -158,16 +175,7 @@ class ForagingMinigameView(discord.ui.View):
     
     def _get_grid_description(self) -> str:
         """Get description of current grid configuration"""
-        if self.foraging_level == 1:
-            return "**Grid:** 1×3 | **Items:** 1 | **Tries:** 2"
-        elif self.foraging_level == 2:
-            return "**Grid:** 2×3 | **Items:** 2 | **Tries:** 3"
-        elif self.foraging_level == 3:
-            return "**Grid:** 3×3 | **Items:** 3 | **Tries:** 4"
-        elif self.foraging_level == 4:
-            return "**Grid:** 4×4 | **Items:** 4 | **Tries:** 5"
-        else:
-            return "**Grid:** 5×5 | **Items:** 5 | **Tries:** 6"
+        return _GRID_DESCRIPTIONS[min(max(self.foraging_level, 1), 5) - 1]
     
     def _update_embed(self, found_item: Optional[str] = None, button_clicked: Optional[Tuple[int, int]] = None):
         """Update the embed with current game state"""
@@ -205,19 +213,14 @@ class ForagingMinigameView(discord.ui.View):
             inline=True
         )
         
-        # Add found items
-        if not self.found_items:
-            found_text = "None yet"
-        else:
-            found_items_with_emojis = []
-            for item_name in self.found_items:
-                # Use material emoji as default for foraging items
-                item_emoji = Emojis.MATERIAL
-                found_items_with_emojis.append(f"• {item_emoji} {item_name}")
-            found_text = "\n".join(found_items_with_emojis)
+        # Add found items (only rebuilt when a new item was found)
+        if len(self.found_items) != self._found_text_count:
+            # Use material emoji as default for foraging items
+            self._found_text = "\n".join(f"• {Emojis.MATERIAL} {item_name}" for item_name in self.found_items)
+            self._found_text_count = len(self.found_items)
         self.embed.add_field(
             name="🎁 Found Items",
-            value=found_text,
+            value=self._found_text,
             inline=True
         )
         
@@ -264,15 +267,7 @@ class ForagingMinigameView(discord.ui.View):
             }
         
         # Map rarity from string to enum
-        rarity_map = {
-            "common": ItemRarity.COMMON,
-            "uncommon": ItemRarity.UNCOMMON,
-            "rare": ItemRarity.RARE,
-            "epic": ItemRarity.EPIC,
-            "legendary": ItemRarity.LEGENDARY
-        }
-        
-        rarity = rarity_map.get(item_data.get("rarity", "common"), ItemRarity.COMMON)
+        rarity = _RARITY_MAP.get(item_data.get("rarity", "common"), ItemRarity.COMMON)
         
         # Create the item
         item = ConsumableItem(
@@ -333,7 +328,7 @@ class ForagingMinigameView(discord.ui.View):
             await interaction.followup.send(self._get_failure_message())
             return
         
-        # Update embed and continue
+        # Update embed and continue (tries and last click change on every click)
         self._update_embed(button_clicked=(button.row, button.col))
         await interaction.response.edit_message(embed=self.embed, view=self)
     
@@ -6,10 +6,17 @@ Handles exploration, activities, and general game features
 import discord
 from discord.ext import commands
 from discord import app_commands
-from ...game import data_loader, RegionManager
+from ...game import data_loader, RegionManager, Combat
 from ...game.enums import PlayerClass, StatType
 # UIEmojis no longer needed - using Emojis constants
-from ..utils import Emojis, EmbedUtils
+from ..utils import Emojis, EmbedUtils, ResponseUtils, requires_character
+from .combat import CombatView
+from .foraging_minigame import ForagingMinigameView
+
+
+# Shared title, color and footer for scout encounters, copied per encounter
+_SCOUT_EMBED_TEMPLATE = discord.Embed(title=f"{Emojis.ATTACK} Enemy Encountered!", color=discord.Color.red())
+_SCOUT_EMBED_TEMPLATE.set_footer(text="Choose to fight or flee.")
 
 
 class ScoutEncounterView(discord.ui.View):
@@ -22,10 +29,21 @@ class ScoutEncounterView(discord.ui.View):
         self.bot = bot
         self.enemy_id = enemy_id
     
+    def _release(self):
+        """Stop listening for clicks and drop references to the player and enemy"""
+        self.stop()
+        self.player = None
+        self.enemy = None
+        self.bot = None
+    
+    async def on_timeout(self):
+        self._release()
+    
     @discord.ui.button(label="Fight", style=discord.ButtonStyle.danger, emoji=Emojis.ATTACK)
     async def fight(self, interaction: discord.Interaction, button: discord.ui.Button):
-        from ...game import Combat
-        from .combat import CombatView
+        if self.is_finished():
+            await ResponseUtils.send_error(interaction, "This encounter has already been resolved.", "Already Resolved")
+            return
         # Start combat session
         combat = Combat([self.player, self.enemy])
         self.bot.set_combat(interaction.channel_id, combat)
@@ -45,16 +63,21 @@ class ScoutEncounterView(discord.ui.View):
         
         combat_view = CombatView(self.player, self.enemy, self.bot, self.enemy_id)
         embed.set_footer(text="Your turn! Choose your action.")
+        self._release()
         await interaction.response.edit_message(embed=embed, view=combat_view)
     
     @discord.ui.button(label="Flee", style=discord.ButtonStyle.secondary, emoji=Emojis.SPEED)
     async def flee(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.is_finished():
+            await ResponseUtils.send_error(interaction, "This encounter has already been resolved.", "Already Resolved")
+            return
         embed = discord.Embed(
             title=f"{Emojis.SPEED} Fled!",
             description=f"**{self.player.name}** decided not to engage **{self.enemy.name}**.",
             color=discord.Color.yellow()
         )
         embed.set_footer(text="Use /explore or /activity to continue your adventure.")
+        self._release()
         await interaction.response.edit_message(embed=embed, view=None)
 
 
@@ -63,26 +86,39 @@ class GameCog(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
+        
+        # The help text is static, so build its embed once
+        self._help_embed = self._build_help_embed()
+    
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Handle errors raised by this cog's slash commands"""
+        await ResponseUtils.send_command_error(interaction, error)
     
     @app_commands.command(name="explore", description="Explore your current region")
-    async def explore(self, interaction: discord.Interaction):
+    @app_commands.checks.cooldown(1, 3.0)
+    @requires_character
+    async def explore(self, interaction: discord.Interaction, player):
         """Explore the current region"""
         user_id = interaction.user.id
-        player = self.bot.get_player(user_id)
-        
-        if not player:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} You don't have a character yet! Use `/create_character` to create one.",
-            )
+        if not self.bot.begin_user_action(user_id):
+            await ResponseUtils.send_busy(interaction)
             return
         
+        try:
+            # Acknowledge right away, then wait for a free handler slot
+            await interaction.response.defer(thinking=True)
+            async with self.bot.interaction_slot():
+                await self._explore(interaction, player)
+        finally:
+            self.bot.end_user_action(user_id)
+    
+    async def _explore(self, interaction: discord.Interaction, player):
+        """Build and send the exploration embed for the player's region"""
         # Get current region
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(player.current_region)
-        current_region = region_manager.get_current_region()
+        current_region = self.bot.region_manager.get_player_region(player)
         
         if not current_region:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Error loading region data. Please try again later.",
             )
             return
@@ -95,30 +131,22 @@ class GameCog(commands.Cog):
         )
         
         # Available activities
-        activities = current_region.available_activities
-        if activities:
-            activity_text = "\n".join([f"• {activity.title()}" for activity in activities])
+        activity_lines = current_region.activity_display_lines
+        if activity_lines:
             embed.add_field(
                 name="🎯 Available Activities",
-                value=activity_text,
+                value="\n".join(activity_lines),
                 inline=True
             )
         
         # Available enemies
-        enemies = current_region.get_available_enemies()
-        if enemies:
-            enemy_data = []
-            for enemy_id in enemies:
-                enemy = data_loader.load_enemy(enemy_id)
-                if enemy:
-                    enemy_data.append(f"• {enemy['name']} (Level {enemy['base_level']})")
-            
-            if enemy_data:
-                embed.add_field(
-                    name="👹 Enemies",
-                    value="\n".join(enemy_data),
-                    inline=True
-                )
+        enemy_lines = current_region.enemy_display_lines
+        if enemy_lines:
+            embed.add_field(
+                name="👹 Enemies",
+                value="\n".join(enemy_lines),
+                inline=True
+            )
         
         # Region info
         region_info = f"**Level:** {current_region.level}\n**Loot Multiplier:** {current_region.loot_multiplier}x\n**Enemy Bonus:** +{current_region.enemy_level_bonus}"
@@ -139,9 +167,10 @@ class GameCog(commands.Cog):
         
         embed.set_footer(text="Use /activity to perform activities in this region!")
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="activity", description="Perform an activity in your current region")
+    @app_commands.checks.cooldown(1, 3.0)
     @app_commands.describe(activity="The activity you want to perform")
     @app_commands.choices(activity=[
         app_commands.Choice(name="Scout", value="scout"),
@@ -149,33 +178,48 @@ class GameCog(commands.Cog):
         app_commands.Choice(name="Farming", value="farming"),
         app_commands.Choice(name="Mining", value="mining")
     ])
-    async def activity(self, interaction: discord.Interaction, activity: app_commands.Choice[str]):
+    @requires_character
+    async def activity(self, interaction: discord.Interaction, player, activity: app_commands.Choice[str]):
         """Perform an activity"""
-        user_id = interaction.user.id
-        player = self.bot.get_player(user_id)
-        
-        if not player:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} You don't have a character yet! Use `/create_character` to create one.",
+        # Reject tired players before touching region or activity data
+        energy_cost = self.bot.activity_energy_costs.get(activity.value, 0)
+        if player.get_stat(StatType.ENERGY) < energy_cost:
+            await ResponseUtils.send_error(
+                interaction,
+                f"You need {energy_cost} energy to perform **{activity.value.title()}**.",
+                "Not Enough Energy",
             )
             return
         
+        user_id = interaction.user.id
+        if not self.bot.begin_user_action(user_id):
+            await ResponseUtils.send_busy(interaction)
+            return
+        
+        try:
+            # Acknowledge right away, then wait for a free handler slot
+            await interaction.response.defer(thinking=True)
+            async with self.bot.interaction_slot():
+                await self._perform_activity(interaction, player, activity)
+        finally:
+            self.bot.end_user_action(user_id)
+    
+    async def _perform_activity(self, interaction: discord.Interaction, player, activity: app_commands.Choice[str]):
+        """Run the selected activity for the player"""
         # Get current region
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(player.current_region)
-        current_region = region_manager.get_current_region()
+        current_region = self.bot.region_manager.get_player_region(player)
         
         if not current_region:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Error loading region data. Please try again later.",
             )
             return
         
         # Check if activity is available
-        available_activities = current_region.available_activities
         activity_name = activity.value
-        if activity_name.lower() not in available_activities:
-            await interaction.response.send_message(
+        if not current_region.has_activity(activity_name):
+            available_activities = current_region.available_activities
+            await interaction.followup.send(
                 f"{Emojis.ERROR} **{activity_name.title()}** is not available in {current_region.name}.\n\nAvailable activities: {', '.join([a.title() for a in available_activities])}",
             )
             return
@@ -183,7 +227,7 @@ class GameCog(commands.Cog):
         # Load activity data
         activity_data = data_loader.load_activity(activity_name.lower())
         if not activity_data:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Activity data not found for **{activity_name.title()}**.",
             )
             return
@@ -191,29 +235,19 @@ class GameCog(commands.Cog):
         # Check energy requirements
         energy_cost = activity_data.get('energy_cost', 0)
         if player.get_stat(StatType.ENERGY) < energy_cost:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Not enough energy! You need {energy_cost} energy to perform **{activity_name.title()}**.",
             )
             return
         
         # Foraging launches the interactive minigame instead of auto-completing
         if activity_name.lower() == "foraging":
-            from .foraging_minigame import ForagingMinigameView
             view = ForagingMinigameView(player, self.bot, activity_data)
-            await interaction.response.send_message(embed=view.embed, view=view)
+            await interaction.followup.send(embed=view.embed, view=view)
             return
 
         # Scout launches the region's encounter flow (may start combat)
         if activity_name.lower() == "scout":
-            # Announce action
-            await interaction.response.send_message(
-                f"🎯 **{player.name}** is scouting the area...",
-            )
-            
-            # Simulate brief delay
-            import asyncio
-            await asyncio.sleep(2)
-
             # Consume energy
             player.modify_stat(StatType.ENERGY, -energy_cost)
 
@@ -227,13 +261,8 @@ class GameCog(commands.Cog):
                 player.discover_enemy(encounter["enemy_id"])
 
                 # Build encounter embed
-                embed = discord.Embed(
-                    title=f"{Emojis.ATTACK} Enemy Encountered!",
-                    description=(
-                        f"**{player.name}** has encountered a **{enemy_data['name']}** while scouting!"
-                    ),
-                    color=discord.Color.red(),
-                )
+                embed = _SCOUT_EMBED_TEMPLATE.copy()
+                embed.description = f"**{player.name}** has encountered a **{enemy_data['name']}** while scouting!"
 
                 enemy_emoji = enemy_data.get("emoji", "👹") if enemy_data else "👹"
                 emoji_url = EmbedUtils.emoji_to_url(enemy_emoji)
@@ -250,39 +279,11 @@ class GameCog(commands.Cog):
                     inline=True,
                 )
 
-                # Create enemy instance and start combat
-                from ...game.entities.enemy import Enemy, EnemyType, EnemyBehavior
-
-                enemy_type_map = {
-                    "normal": EnemyType.NORMAL,
-                    "mini_boss": EnemyType.MINIBOSS,
-                    "boss": EnemyType.BOSS,
-                }
-                enemy_type = enemy_type_map.get(enemy_data.get("type", "normal"), EnemyType.NORMAL)
-
-                enemy_instance = Enemy(
-                    name=enemy_data["name"],
-                    enemy_type=enemy_type,
-                    level=enemy_data["base_level"],
-                    behavior=EnemyBehavior.AGGRESSIVE,
-                    emoji=enemy_data.get("emoji", "👹"),
-                )
-
-                # Load loot table
-                for loot_entry in enemy_data.get("loot_table", []):
-                    enemy_instance.add_loot_item(
-                        item_name=loot_entry["item"],
-                        drop_chance=loot_entry["drop_chance"],
-                        quantity=(
-                            loot_entry["quantity"][0]
-                            if isinstance(loot_entry["quantity"], list)
-                            else loot_entry["quantity"]
-                        ),
-                    )
+                # Spawn enemy from its preloaded prototype
+                enemy_instance = self.bot.spawn_enemy(encounter["enemy_id"], enemy_data)
 
                 # Provide simple choice to fight or flee instead of full combat controls
                 choice_view = ScoutEncounterView(player, enemy_instance, self.bot, encounter["enemy_id"])
-                embed.set_footer(text="Choose to fight or flee.")
                 await interaction.followup.send(embed=embed, view=choice_view)
                 return
 
@@ -292,15 +293,6 @@ class GameCog(commands.Cog):
             )
             return
         
-        # Perform non-minigame activities (simplified)
-        await interaction.response.send_message(
-            f"🎯 **{player.name}** is performing **{activity_name.title()}**...",
-        )
-        
-        # Simulate activity duration
-        import asyncio
-        await asyncio.sleep(2)
-        
         # Calculate rewards
         experience_reward = activity_data.get('experience_reward', 0)
         player.add_experience(experience_reward)
@@ -332,17 +324,9 @@ class GameCog(commands.Cog):
         await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="regions", description="View available regions")
-    async def regions(self, interaction: discord.Interaction):
+    @requires_character
+    async def regions(self, interaction: discord.Interaction, player):
         """View available regions"""
-        user_id = interaction.user.id
-        player = self.bot.get_player(user_id)
-        
-        if not player:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} You don't have a character yet! Use `/create_character` to create one.",
-            )
-            return
-        
         # Get accessible regions
         accessible_regions = self.bot.region_manager.get_accessible_regions(player)
         
@@ -379,6 +363,11 @@ class GameCog(commands.Cog):
     @app_commands.command(name="help", description="Get help with PocketRPG commands")
     async def help_command(self, interaction: discord.Interaction):
         """Show help information"""
+        await interaction.response.send_message(embed=self._help_embed)
+    
+    @staticmethod
+    def _build_help_embed() -> discord.Embed:
+        """Create the help embed listing all commands"""
         embed = discord.Embed(
             title=f"{Emojis.CHARACTER} PocketRPG Help",
             description="Welcome to PocketRPG! Here are the available commands:",
@@ -405,7 +394,7 @@ class GameCog(commands.Cog):
         
         embed.set_footer(text="PocketRPG - Your adventure awaits!")
         
-        await interaction.response.send_message(embed=embed)
+        return embed
 
 
 async def setup(bot):
@@ -4,23 +4,111 @@ Features interactive buttons, select menus, and modals for better UX
 """
 
 import discord
+import functools
+import weakref
+from typing import List
 from discord.ext import commands
 from discord import app_commands
 from ...game import PlayerCreation, PlayerClass
 from ...game.enums import StatType, EquipmentSlot
 
 # UIEmojis no longer needed - using Emojis constants
-from ..utils import EmbedUtils, ResponseUtils, PlayerUtils, Emojis
+from ..utils import EmbedUtils, ResponseUtils, PlayerUtils, Emojis, requires_character
 from .game import ScoutEncounterView
+from .foraging_minigame import ForagingMinigameView
 from ...utils.ui_emojis import UIEmojis
 
+# Stats shown on the character created embed
+_STARTING_STATS = (StatType.HEALTH, StatType.MAX_HEALTH, StatType.ENERGY, StatType.MAX_ENERGY)
+
+# Button for each activity that can be started from ActivitySelectionView
+_ACTIVITY_BUTTON_CONFIGS = {
+    "scout": {
+        "label": "Scout",
+        "style": discord.ButtonStyle.danger,
+        "emoji": Emojis.INSPECT,
+    },
+    "foraging": {
+        "label": "Foraging",
+        "style": discord.ButtonStyle.success,
+        "emoji": Emojis.EXPLORE,
+    },
+    "farming": {
+        "label": "Farming",
+        "style": discord.ButtonStyle.success,
+        "emoji": Emojis.EXPLORE,
+    },
+    "mining": {
+        "label": "Mining",
+        "style": discord.ButtonStyle.secondary,
+        "emoji": Emojis.EXPLORE,
+    },
+}
+
+# Item detail embed colour by rarity
+_RARITY_COLORS = {
+    "common": discord.Color.light_grey(),
+    "uncommon": discord.Color.green(),
+    "rare": discord.Color.blue(),
+    "epic": discord.Color.purple(),
+    "legendary": discord.Color.gold(),
+}
+
+@functools.lru_cache(maxsize=64)
+def _stat_label(stat: str) -> str:
+    """Stat key as shown on item details, e.g. "strength" -> "Strength" """
+    return stat.title()
+
+
+# Item detail lines for known effect types; unknown types fall back to "• Type: amount"
+_EFFECT_FORMATTERS = {
+    "heal": lambda effect: f"• Heals {effect.get('amount', 0)} HP",
+    "mana_restore": lambda effect: f"• Restores {effect.get('amount', 0)} Mana",
+    "stat_boost": lambda effect: (
+        f"• +{effect.get('amount', 0)} {_stat_label(effect.get('stat', 'unknown'))} "
+        f"for {effect.get('duration', 0)} turns"
+    ),
+}
+
+# Activity id -> shared "Coming Soon!" embed; ids come from the activity buttons, so this stays small
+_LOCKED_ACTIVITY_EMBEDS = {}
+
+# Inventory -> (revision, inspect dropdown options); entries go away with their inventory
+_SELECT_OPTIONS_CACHE = weakref.WeakKeyDictionary()
+
+# Placeholder text for activities that aren't playable yet
+_COMING_SOON_MESSAGES = {
+    "farming": f"{Emojis.EXPLORE} **Farming** will be coming soon! This will be a minigame where you can grow crops and harvest resources.",
+    "mining": f"{Emojis.EXPLORE} **Mining** will be coming soon! This will be a minigame where you can extract valuable minerals and ores.",
+}
+
+# Static class descriptions, used by the class selection and character created embeds
+_CLASS_DESCRIPTIONS = {
+    player_class: PlayerCreation.get_class_description(player_class)
+    for player_class in PlayerCreation.get_available_classes()
+}
+
+# Class selection embed; copies share its field list, so only the description varies per submission
+_CLASS_EMBED_TEMPLATE = discord.Embed(
+    title=f"{UIEmojis.get_ui('class')} Choose Your Class",
+    color=discord.Color.blue(),
+)
+for _player_class, _description in _CLASS_DESCRIPTIONS.items():
+    _CLASS_EMBED_TEMPLATE.add_field(
+        name=f"{UIEmojis.get_player_class(_player_class.value)} {_player_class.value.title()}",
+        value=_description,
+        inline=False,
+    )
+del _player_class, _description
+
 
 class CharacterCreationModal(discord.ui.Modal):
     """Modal for character creation with name input"""
 
-    def __init__(self, bot):
-        super().__init__(title="Create Your Character")
+    def __init__(self, bot, user_id: int):
+        super().__init__(title="Create Your Character", timeout=180)
         self.bot = bot
+        self.user_id = user_id
 
         self.name_input = discord.ui.TextInput(
             label="Character Name",
@@ -31,9 +119,14 @@ class CharacterCreationModal(discord.ui.Modal):
         )
         self.add_item(self.name_input)
 
+    async def on_timeout(self):
+        """Let the user open a new modal once this one expires unanswered"""
+        self.bot.pending_creations.discard(self.user_id)
+
     async def on_submit(self, interaction: discord.Interaction):
         """Handle character creation form submission"""
         user_id = interaction.user.id
+        self.bot.pending_creations.discard(user_id)
 
         # Check if player already exists
         can_create, error_msg = PlayerUtils.check_player_not_exists(self.bot, user_id)
@@ -53,23 +146,8 @@ class CharacterCreationModal(discord.ui.Modal):
         # Create class selection view
         view = ClassSelectionView(name, self.bot)
 
-        class_emoji = UIEmojis.get_ui("class")
-        embed = discord.Embed(
-            title=f"{class_emoji} Choose Your Class",
-            description=f"**{name}**, select your character class:",
-            color=discord.Color.blue(),
-        )
-
-        # Add class descriptions
-        classes = PlayerCreation.get_available_classes()
-        for player_class in classes:
-            description = PlayerCreation.get_class_description(player_class)
-            class_emoji = UIEmojis.get_player_class(player_class.value)
-            embed.add_field(
-                name=f"{class_emoji} {player_class.value.title()}",
-                value=description,
-                inline=False,
-            )
+        embed = _CLASS_EMBED_TEMPLATE.copy()
+        embed.description = f"**{name}**, select your character class:"
 
         await interaction.response.send_message(
             embed=embed,
@@ -121,74 +199,99 @@ class ClassSelectionView(discord.ui.View):
         self, interaction: discord.Interaction, player_class: PlayerClass
     ):
         """Create character with selected class"""
+        # Re-check here: another class view for this user may have already created one.
+        # Nothing awaits between this check and set_player, so the two can't interleave.
+        can_create, error_msg = PlayerUtils.check_player_not_exists(self.bot, interaction.user.id)
+        if not can_create:
+            await ResponseUtils.send_error(interaction, error_msg, "Character Exists")
+            return
+
+        # Create player; bad item/enum values in the starting data surface as ValueError,
+        # anything else is a bug and is left to the view's error handler
         try:
-            # Create player
             player = PlayerCreation.create_player(self.character_name, player_class)
-            player.set_user_id(interaction.user.id)
-
-            # Store player
-            self.bot.set_player(interaction.user.id, player)
+        except ValueError as e:
+            await ResponseUtils.send_error(interaction, f"Error creating character: {e}", "Creation Failed")
+            return
+        player.set_user_id(interaction.user.id)
 
-            # Create success embed
-            embed = EmbedUtils.create_success_embed(
-                f"Welcome to PocketRPG, **{self.character_name}**!", "Character Created"
-            )
+        # Store player
+        self.bot.set_player(interaction.user.id, player)
 
-            embed.add_field(
-                name="Class",
-                value=f"{player_class.value.title()} - {PlayerCreation.get_class_description(player_class)}",
-                inline=False,
-            )
+        # Create success embed
+        embed = EmbedUtils.create_success_embed(
+            f"Welcome to PocketRPG, **{self.character_name}**!", "Character Created"
+        )
 
-            embed.add_field(
-                name="Starting Stats",
-                value=f"**Level:** {player.level}\n**Health:** {player.get_stat(StatType.HEALTH)}/{player.get_stat(StatType.MAX_HEALTH)}\n**Energy:** {player.get_stat(StatType.ENERGY)}/{player.get_stat(StatType.MAX_ENERGY)}\n**Gold:** {player.gold}",
-                inline=True,
-            )
+        embed.add_field(
+            name="Class",
+            value=f"{player_class.value.title()} - {_CLASS_DESCRIPTIONS[player_class]}",
+            inline=False,
+        )
 
-            embed.add_field(
-                name="Location",
-                value=f"**{player.current_region.title()}**\n*Your adventure begins here!*",
-                inline=True,
-            )
+        stats = player.get_stats(_STARTING_STATS)
+        embed.add_field(
+            name="Starting Stats",
+            value=f"**Level:** {player.level}\n**Health:** {stats[StatType.HEALTH]}/{stats[StatType.MAX_HEALTH]}\n**Energy:** {stats[StatType.ENERGY]}/{stats[StatType.MAX_ENERGY]}\n**Gold:** {player.gold}",
+            inline=True,
+        )
 
-            # Add action buttons
-            view = CharacterActionView(player, self.bot)
+        embed.add_field(
+            name="Location",
+            value=f"**{player.current_region.title()}**\n*Your adventure begins here!*",
+            inline=True,
+        )
 
-            embed.set_footer(text="Use the buttons below to get started!")
+        # Add action buttons
+        view = CharacterActionView.for_message(self.bot)
 
-            await interaction.response.edit_message(embed=embed, view=view)
+        embed.set_footer(text="Use the buttons below to get started!")
 
-        except Exception as e:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} Error creating character: {str(e)}",
-            )
+        await interaction.response.edit_message(embed=embed, view=view)
 
 
-class CharacterActionView(discord.ui.View):
-    """View with action buttons for character actions and continuing after activities"""
+class _PersistentView(discord.ui.View):
+    """
+    Stateless view with fixed custom_ids. One instance is registered with bot.add_view
+    at startup and handles every click, resolving the clicking user's character.
+    """
 
-    def __init__(self, player, bot, show_enemies=False):
-        super().__init__(timeout=300)
-        self.player = player
+    def __init__(self, bot):
+        super().__init__(timeout=None)
         self.bot = bot
-        self.show_enemies = show_enemies
+
+    @classmethod
+    def for_message(cls, bot):
+        """
+        Copy to attach to an outgoing message. It is stopped before sending so
+        discord.py doesn't keep it in the view store for that message; clicks
+        still reach the registered instance by custom_id.
+        """
+        view = cls(bot)
+        view.stop()
+        return view
+
+
+class CharacterActionView(_PersistentView):
+    """Persistent action buttons for character actions and continuing after activities"""
 
     @discord.ui.button(
-        label="Explore", style=discord.ButtonStyle.success, emoji=Emojis.EXPLORE
+        label="Explore",
+        style=discord.ButtonStyle.success,
+        emoji=Emojis.EXPLORE,
+        custom_id="pocketrpg:explore",
     )
+    @requires_character
     async def explore(
-        self, interaction: discord.Interaction, button: discord.ui.Button
+        self, interaction: discord.Interaction, player, button: discord.ui.Button
     ):
         """Start exploring"""
-        await self._show_exploration_view(interaction)
+        await self._show_exploration_view(interaction, player)
 
-    async def _show_exploration_view(self, interaction: discord.Interaction):
+    async def _show_exploration_view(self, interaction: discord.Interaction, player):
         """Show exploration view for the player's current region"""
         # Get current region
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(self.player.current_region)
-        current_region = region_manager.get_current_region()
+        current_region = self.bot.region_manager.get_player_region(player)
 
         if not current_region:
             await interaction.response.send_message(
@@ -203,170 +306,92 @@ class CharacterActionView(discord.ui.View):
             color=discord.Color.green(),
         )
 
+        # Split the region's activities into unlocked and locked in one pass
+        unlocked_activities = []
+        locked_activities = []
+        for activity in current_region.available_activities:
+            if player.has_activity_unlocked(activity):
+                unlocked_activities.append(activity)
+            else:
+                locked_activities.append(activity)
+        titles = current_region.activity_titles
+
         # Available activities (only unlocked ones)
-        unlocked_activities = current_region.get_unlocked_activities(self.player)
         if unlocked_activities:
             activity_text = "\n".join(
-                [f"• {activity.title()}" for activity in unlocked_activities]
+                [f"• {titles[activity]}" for activity in unlocked_activities]
             )
             embed.add_field(
                 name="🎯 Available Activities", value=activity_text, inline=True
             )
 
         # Show locked activities with unlock hints
-        all_activities = current_region.available_activities
-        locked_activities = [
-            activity
-            for activity in all_activities
-            if not self.player.has_activity_unlocked(activity)
-        ]
         if locked_activities:
             locked_text = "\n".join(
                 [
-                    f"🔒 {activity.title()} (Coming Soon)"
+                    f"🔒 {titles[activity]} (Coming Soon)"
                     for activity in locked_activities
                 ]
             )
             embed.add_field(name="🔒 Locked Activities", value=locked_text, inline=True)
 
         # Available enemies with discovery status
-        enemies = current_region.get_enemies_with_discovery(self.player)
-        if enemies:
-            enemy_data = []
-            for enemy in enemies:
-                if enemy["discovered"]:
-                    # Get enemy emoji from emoji manager
-                    enemy_emoji = enemy["data"]["emoji"] if enemy["data"] else "👹"
-
-                    enemy_data.append(
-                        f"{enemy_emoji} {enemy['name']} (Level {enemy['level']})"
-                    )
-                else:
-                    enemy_data.append(f"❓ Unknown Enemy")
-
-            if enemy_data:
-                embed.add_field(
-                    name="👹 Enemies",
-                    value="\n".join(enemy_data),
-                    inline=False,
-                )
+        enemy_lines = current_region.get_enemy_discovery_lines(player)
+        if enemy_lines:
+            embed.add_field(
+                name="👹 Enemies",
+                value="\n".join(enemy_lines),
+                inline=False,
+            )
 
-        view = ActivitySelectionView(self.player, self.bot)
+        view = ActivitySelectionView(player, self.bot, unlocked_activities)
         await interaction.response.send_message(embed=embed, view=view)
 
     @discord.ui.button(
         label="View Character",
         style=discord.ButtonStyle.secondary,
         emoji=Emojis.CHARACTER,
+        custom_id="pocketrpg:view_character",
     )
+    @requires_character
     async def view_character(
-        self, interaction: discord.Interaction, button: discord.ui.Button
+        self, interaction: discord.Interaction, player, button: discord.ui.Button
     ):
         """View character details (summary)"""
-        embed = EmbedUtils.create_character_summary_embed(self.player)
-        view = CharacterSummaryView(self.player, self.bot)
+        embed = EmbedUtils.create_character_summary_embed(player)
+        view = CharacterSummaryView.for_message(self.bot)
         await interaction.response.send_message(embed=embed, view=view)
 
 
-class CharacterSummaryView(discord.ui.View):
-    """View for character summary with equipment toggle"""
-
-    def __init__(self, player, bot):
-        super().__init__(timeout=120)
-        self.player = player
-        self.bot = bot
+class CharacterSummaryView(_PersistentView):
+    """Persistent view for character summary with equipment toggle"""
 
     @discord.ui.button(
-        label="Equipment", style=discord.ButtonStyle.secondary, emoji=Emojis.EQUIPMENT
+        label="Equipment",
+        style=discord.ButtonStyle.secondary,
+        emoji=Emojis.EQUIPMENT,
+        custom_id="pocketrpg:equipment",
     )
+    @requires_character
     async def show_equipment(
-        self, interaction: discord.Interaction, button: discord.ui.Button
+        self, interaction: discord.Interaction, player, button: discord.ui.Button
     ):
-        embed = EmbedUtils.create_equipment_embed(self.player)
+        embed = EmbedUtils.create_equipment_embed(player)
         await interaction.response.send_message(embed=embed)
 
     @discord.ui.button(
-        label="Inventory", style=discord.ButtonStyle.secondary, emoji=Emojis.INVENTORY
+        label="Inventory",
+        style=discord.ButtonStyle.secondary,
+        emoji=Emojis.INVENTORY,
+        custom_id="pocketrpg:inventory",
     )
+    @requires_character
     async def view_inventory(
-        self, interaction: discord.Interaction, button: discord.ui.Button
+        self, interaction: discord.Interaction, player, button: discord.ui.Button
     ):
         """View inventory contents"""
-        embed = EmbedUtils.create_inventory_embed(self.player)
-        view = InventoryView(self.player, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-
-    async def _show_exploration_view(self, interaction: discord.Interaction):
-        """Shared method to show exploration view"""
-        # Get current region
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(self.player.current_region)
-        current_region = region_manager.get_current_region()
-
-        if not current_region:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} Error loading region data. Please try again later.",
-            )
-            return
-
-        # Create exploration embed
-        embed = discord.Embed(
-            title=f"{Emojis.EXPLORE} Exploring {current_region.name}",
-            description=current_region.description,
-            color=discord.Color.green(),
-        )
-
-        # Available activities (only unlocked ones)
-        unlocked_activities = current_region.get_unlocked_activities(self.player)
-        if unlocked_activities:
-            activity_text = "\n".join(
-                [f"• {activity.title()}" for activity in unlocked_activities]
-            )
-            embed.add_field(
-                name="🎯 Available Activities", value=activity_text, inline=True
-            )
-
-        # Show locked activities with unlock hints
-        all_activities = current_region.available_activities
-        locked_activities = [
-            activity
-            for activity in all_activities
-            if not self.player.has_activity_unlocked(activity)
-        ]
-        if locked_activities:
-            locked_text = "\n".join(
-                [
-                    f"🔒 {activity.title()} (Coming Soon)"
-                    for activity in locked_activities
-                ]
-            )
-            embed.add_field(name="🔒 Locked Activities", value=locked_text, inline=True)
-
-        # Available enemies with discovery status
-        enemies = current_region.get_enemies_with_discovery(self.player)
-        if enemies:
-            enemy_data = []
-            for enemy in enemies:
-                if enemy["discovered"]:
-                    # Get enemy emoji from emoji manager
-                    enemy_emoji = enemy["data"]["emoji"] if enemy["data"] else "👹"
-
-                    enemy_data.append(
-                        f"{enemy_emoji} {enemy['name']} (Level {enemy['level']})"
-                    )
-                else:
-                    enemy_data.append(f"❓ Unknown Enemy")
-
-            if enemy_data:
-                embed.add_field(
-                    name="👹 Enemies", value="\n".join(enemy_data), inline=True
-                )
-
-        # Add activity selection
-        view = ActivitySelectionView(self.player, self.bot)
-
-        embed.set_footer(text="Choose an activity to get started!")
-
+        embed = EmbedUtils.create_inventory_embed(player)
+        view = InventoryView(player, self.bot)
         await interaction.response.send_message(embed=embed, view=view)
 
 
@@ -415,35 +440,56 @@ class ItemInspectView(discord.ui.View):
         self.add_item(self.item_select)
 
 
+def _locked_activity_embed(activity: str) -> discord.Embed:
+    """Coming-soon embed for a locked activity, built on first use and shared afterwards"""
+    embed = _LOCKED_ACTIVITY_EMBEDS.get(activity)
+    if embed is None:
+        message = _COMING_SOON_MESSAGES.get(
+            activity, f"🔒 **{activity.title()}** is not yet available."
+        )
+        embed = discord.Embed(
+            title="🚧 Coming Soon!",
+            description=message,
+            color=discord.Color.orange(),
+        )
+        embed.add_field(
+            name="💡 Tip",
+            value="Try foraging to gather materials that might unlock new activities!",
+            inline=False,
+        )
+        _LOCKED_ACTIVITY_EMBEDS[activity] = embed
+    return embed
+
+
+def _inventory_select_options(inventory) -> List[discord.SelectOption]:
+    """One option per inventory item, rebuilt only when the inventory has changed"""
+    cached = _SELECT_OPTIONS_CACHE.get(inventory)
+    if cached and cached[0] == inventory.revision:
+        return cached[1]
+
+    options = [
+        discord.SelectOption(
+            label=f"{item.emoji} {item.name} x{item.quantity}",
+            description=f"{item.item_type.value.title()} • {item.rarity.value.title()}",
+            value=item_name,
+        )
+        for item_name, item in inventory.items.items()
+    ]
+    _SELECT_OPTIONS_CACHE[inventory] = (inventory.revision, options)
+    return options
+
+
 class ItemSelectDropdown(discord.ui.Select):
     """Dropdown for selecting items to inspect"""
 
     def __init__(self, player):
         self.player = player
 
-        # Add options for each item in inventory
-        options = []
-        for item_name, item in player.inventory.items.items():
-            # Add item emoji (try specific item first, then fallback to item type)
-            # Use UIEmojis directly
-            item_emoji = item.emoji
-
-            label = f"{item_emoji} {item.name} x{item.quantity}"
-            description = (
-                f"{item.item_type.value.title()} • {item.rarity.value.title()}"
-            )
-
-            options.append(
-                discord.SelectOption(
-                    label=label, description=description, value=item_name
-                )
-            )
-
         super().__init__(
             placeholder="Choose an item to inspect...",
             min_values=1,
             max_values=1,
-            options=options,
+            options=list(_inventory_select_options(player.inventory)),
         )
 
     async def callback(self, interaction: discord.Interaction):
@@ -465,39 +511,21 @@ class ItemSelectDropdown(discord.ui.Select):
     def create_item_detail_embed(self, item) -> discord.Embed:
         """Create detailed item information embed"""
         # Get rarity color
-        rarity_colors = {
-            "common": discord.Color.light_grey(),
-            "uncommon": discord.Color.green(),
-            "rare": discord.Color.blue(),
-            "epic": discord.Color.purple(),
-            "legendary": discord.Color.gold(),
-        }
-
-        color = rarity_colors.get(item.rarity.value, discord.Color.light_grey())
-
-        # Get item emoji (try specific item first, then fallback to item type)
-        # Use UIEmojis directly
-        item_emoji = item.emoji
-
-        embed = discord.Embed(
-            title=f"{item_emoji} {item.name}",
-            description=item.description or "No description available.",
-            color=color,
-        )
-
-        # Basic item info
-        embed.add_field(
-            name="📋 Basic Info",
-            value=f"**Type:** {item.item_type.value.title()}\n**Rarity:** {item.rarity.value.title()}\n**Quality:** {item.quality.value.title()}\n**Value:** {item.value} gold",
-            inline=True,
-        )
-
-        # Quantity and stack info
-        embed.add_field(
-            name="📦 Inventory",
-            value=f"**Quantity:** {item.quantity}\n**Stackable:** {'Yes' if item.stackable else 'No'}\n**Max Stack:** {item.max_stack}",
-            inline=True,
-        )
+        color = _RARITY_COLORS.get(item.rarity.value, _RARITY_COLORS["common"])
+
+        # Basic item info, quantity and stack info
+        fields = [
+            {
+                "name": "📋 Basic Info",
+                "value": f"**Type:** {item.item_type.value.title()}\n**Rarity:** {item.rarity.value.title()}\n**Quality:** {item.quality.value.title()}\n**Value:** {item.value} gold",
+                "inline": True,
+            },
+            {
+                "name": "📦 Inventory",
+                "value": f"**Quantity:** {item.quantity}\n**Stackable:** {'Yes' if item.stackable else 'No'}\n**Max Stack:** {item.max_stack}",
+                "inline": True,
+            },
+        ]
 
         # Requirements
         requirements = []
@@ -507,133 +535,113 @@ class ItemSelectDropdown(discord.ui.Select):
             requirements.append(f"{item.class_requirement.title()} Class")
 
         if requirements:
-            embed.add_field(
-                name="⚡ Requirements", value="\n".join(requirements), inline=True
+            fields.append(
+                {"name": "⚡ Requirements", "value": "\n".join(requirements), "inline": True}
             )
 
         # Item-specific details
-        if hasattr(item, "effects") and item.effects:
-            effects_text = ""
-            for effect in item.effects:
+        effects = getattr(item, "effects", None)
+        if effects:
+            effect_lines = []
+            for effect in effects:
                 effect_type = effect.get("type", "unknown")
-                amount = effect.get("amount", 0)
-                if effect_type == "heal":
-                    effects_text += f"• Heals {amount} HP\n"
-                elif effect_type == "mana_restore":
-                    effects_text += f"• Restores {amount} Mana\n"
-                elif effect_type == "stat_boost":
-                    stat = effect.get("stat", "unknown")
-                    duration = effect.get("duration", 0)
-                    effects_text += f"• +{amount} {stat.title()} for {duration} turns\n"
+                formatter = _EFFECT_FORMATTERS.get(effect_type)
+                if formatter:
+                    effect_lines.append(formatter(effect))
                 else:
-                    effects_text += f"• {effect_type.title()}: {amount}\n"
+                    effect_lines.append(f"• {effect_type.title()}: {effect.get('amount', 0)}")
 
-            if effects_text:
-                embed.add_field(
-                    name=f"{Emojis.BUFF} Effects",
-                    value=effects_text.strip(),
-                    inline=False,
-                )
+            fields.append(
+                {"name": f"{Emojis.BUFF} Effects", "value": "\n".join(effect_lines), "inline": False}
+            )
 
         # Equipment-specific details
-        if hasattr(item, "damage") and item.damage:
-            embed.add_field(
-                name=f"{Emojis.ATTACK} Weapon Stats",
-                value=f"**Damage:** {item.damage}",
-                inline=True,
+        damage = getattr(item, "damage", None)
+        if damage:
+            fields.append(
+                {"name": f"{Emojis.ATTACK} Weapon Stats", "value": f"**Damage:** {damage}", "inline": True}
             )
 
-        if hasattr(item, "defense") and item.defense:
-            embed.add_field(
-                name=f"{Emojis.DEFENSE} Armor Stats",
-                value=f"**Defense:** {item.defense}",
-                inline=True,
+        defense = getattr(item, "defense", None)
+        if defense:
+            fields.append(
+                {"name": f"{Emojis.DEFENSE} Armor Stats", "value": f"**Defense:** {defense}", "inline": True}
             )
 
         # Stat bonuses
-        if hasattr(item, "stat_bonuses") and item.stat_bonuses:
-            bonuses_text = ""
-            for stat, bonus in item.stat_bonuses.items():
-                bonuses_text += f"• +{bonus} {stat.title()}\n"
-
-            if bonuses_text:
-                embed.add_field(
-                    name=f"{Emojis.STATS} Stat Bonuses",
-                    value=bonuses_text.strip(),
-                    inline=True,
-                )
-
-        embed.set_footer(text=f"Item ID: {item.name}")
+        stat_bonuses = getattr(item, "stat_bonuses", None)
+        if stat_bonuses:
+            bonuses_text = "\n".join(
+                [f"• +{bonus} {_stat_label(stat)}" for stat, bonus in stat_bonuses.items()]
+            )
+            fields.append(
+                {"name": f"{Emojis.STATS} Stat Bonuses", "value": bonuses_text, "inline": True}
+            )
 
-        return embed
+        # Build the whole embed in one go rather than field by field
+        return discord.Embed.from_dict({
+            "title": f"{item.emoji} {item.name}",
+            "description": item.description or "No description available.",
+            "color": color.value,
+            "fields": fields,
+            "footer": {"text": f"Item ID: {item.name}"},
+        })
 
 
 class ActivitySelectionView(discord.ui.View):
     """View for selecting activities with buttons"""
 
-    def __init__(self, player, bot):
+    def __init__(self, player, bot, unlocked_activities=None):
         super().__init__(timeout=60)
         self.player = player
         self.bot = bot
 
         # Add buttons dynamically based on unlocked activities
-        self._add_activity_buttons()
-
-    def _add_activity_buttons(self):
-        """Add buttons for unlocked activities"""
-        # Get current region and unlocked activities
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(self.player.current_region)
-        current_region = region_manager.get_current_region()
+        self._add_activity_buttons(unlocked_activities)
 
-        if not current_region:
-            return
-
-        unlocked_activities = current_region.get_unlocked_activities(self.player)
-
-        # Activity button configurations
-        activity_configs = {
-            "scout": {
-                "label": "Scout",
-                "style": discord.ButtonStyle.danger,
-                "emoji": Emojis.INSPECT,
-            },
-            "foraging": {
-                "label": "Foraging",
-                "style": discord.ButtonStyle.success,
-                "emoji": Emojis.EXPLORE,
-            },
-            "farming": {
-                "label": "Farming",
-                "style": discord.ButtonStyle.success,
-                "emoji": Emojis.EXPLORE,
-            },
-            "mining": {
-                "label": "Mining",
-                "style": discord.ButtonStyle.secondary,
-                "emoji": Emojis.EXPLORE,
-            },
-        }
+    def _add_activity_buttons(self, unlocked_activities=None):
+        """Add buttons for unlocked activities, looking them up if the caller hasn't already"""
+        if unlocked_activities is None:
+            current_region = self.bot.region_manager.get_player_region(self.player)
+            if not current_region:
+                return
+            unlocked_activities = current_region.get_unlocked_activities(self.player)
 
-        # Add buttons for unlocked activities
+        # Add buttons for unlocked activities, all routed through one callback
         for activity in unlocked_activities:
-            if activity in activity_configs:
-                config = activity_configs[activity]
-                button = discord.ui.Button(
-                    label=config["label"], style=config["style"], emoji=config["emoji"]
-                )
-                button.callback = lambda i, act=activity: self.start_activity(i, act)
+            if activity in _ACTIVITY_BUTTON_CONFIGS:
+                button = discord.ui.Button(**_ACTIVITY_BUTTON_CONFIGS[activity])
+                # Auto-generated custom_ids keep each user's view distinct in the view store
+                button.callback = functools.partial(self.start_activity, activity=activity)
                 self.add_item(button)
 
     async def start_activity(self, interaction: discord.Interaction, activity: str):
         """Start the selected activity"""
+        user_id = interaction.user.id
+        if not self.bot.begin_user_action(user_id):
+            await ResponseUtils.send_busy(interaction)
+            return
+
+        # Lock the buttons before the first await so repeat clicks never dispatch
+        for child in self.children:
+            child.disabled = True
+        self.stop()
+
+        try:
+            # Acknowledge by showing the disabled buttons, then wait for a free handler slot
+            await interaction.response.edit_message(view=self)
+            async with self.bot.interaction_slot():
+                await self._start_activity(interaction, activity)
+        finally:
+            self.bot.end_user_action(user_id)
+
+    async def _start_activity(self, interaction: discord.Interaction, activity: str):
+        """Run the selected activity for the player"""
         # Get current region
-        region_manager = self.bot.region_manager
-        region_manager.set_current_region(self.player.current_region)
-        current_region = region_manager.get_current_region()
+        current_region = self.bot.region_manager.get_player_region(self.player)
 
         if not current_region:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Error loading region data. Please try again later.",
             )
             return
@@ -641,34 +649,12 @@ class ActivitySelectionView(discord.ui.View):
         # Check if activity is unlocked
         if not self.player.has_activity_unlocked(activity.lower()):
             # Show placeholder message for locked activities
-            placeholder_messages = {
-                "farming": f"{Emojis.EXPLORE} **Farming** will be coming soon! This will be a minigame where you can grow crops and harvest resources.",
-                "mining": f"{Emojis.EXPLORE} **Mining** will be coming soon! This will be a minigame where you can extract valuable minerals and ores.",
-            }
-
-            message = placeholder_messages.get(
-                activity.lower(), f"🔒 **{activity.title()}** is not yet available."
-            )
-
-            embed = discord.Embed(
-                title="🚧 Coming Soon!",
-                description=message,
-                color=discord.Color.orange(),
-            )
-
-            embed.add_field(
-                name="💡 Tip",
-                value="Try foraging to gather materials that might unlock new activities!",
-                inline=False,
-            )
-
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=_locked_activity_embed(activity.lower()))
             return
 
         # Check if activity is available in region
-        available_activities = current_region.available_activities
-        if activity.lower() not in available_activities:
-            await interaction.response.send_message(
+        if not current_region.has_activity(activity):
+            await interaction.followup.send(
                 f"{Emojis.ERROR} **{activity.title()}** is not available in {current_region.name}."
             )
             return
@@ -678,7 +664,7 @@ class ActivitySelectionView(discord.ui.View):
             activity.lower()
         )
         if not activity_data:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Activity data not found for **{activity.title()}**.",
             )
             return
@@ -686,21 +672,11 @@ class ActivitySelectionView(discord.ui.View):
         # Check energy requirements
         energy_cost = activity_data.get("energy_cost", 0)
         if self.player.get_stat(StatType.ENERGY) < energy_cost:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{Emojis.ERROR} Not enough energy! You need {energy_cost} energy to perform **{activity.title()}**.",
             )
             return
 
-        # Perform activity
-        await interaction.response.send_message(
-            f"🎯 **{self.player.name}** is performing **{activity.title()}**...",
-        )
-
-        # Simulate activity duration
-        import asyncio
-
-        await asyncio.sleep(2)  # Simulate activity time
-
         # Consume energy first
         self.player.modify_stat(StatType.ENERGY, -energy_cost)
 
@@ -741,39 +717,7 @@ class ActivitySelectionView(discord.ui.View):
                 )
 
                 # Create enemy instance for combat
-                from ...game.entities.enemy import Enemy, EnemyType, EnemyBehavior
-
-                # Map enemy type from data to enum
-                enemy_type_map = {
-                    "normal": EnemyType.NORMAL,
-                    "mini_boss": EnemyType.MINIBOSS,
-                    "boss": EnemyType.BOSS,
-                }
-
-                enemy_type = enemy_type_map.get(
-                    enemy_data.get("type", "normal"), EnemyType.NORMAL
-                )
-
-                enemy_instance = Enemy(
-                    name=enemy_data["name"],
-                    enemy_type=enemy_type,
-                    level=enemy_data["base_level"],
-                    behavior=EnemyBehavior.AGGRESSIVE,
-                    emoji=enemy_data.get("emoji", "👹"),
-                )
-
-                # Load loot table from enemy data
-                loot_table = enemy_data.get("loot_table", [])
-                for loot_entry in loot_table:
-                    enemy_instance.add_loot_item(
-                        item_name=loot_entry["item"],
-                        drop_chance=loot_entry["drop_chance"],
-                        quantity=(
-                            loot_entry["quantity"][0]
-                            if isinstance(loot_entry["quantity"], list)
-                            else loot_entry["quantity"]
-                        ),
-                    )
+                enemy_instance = self.bot.spawn_enemy(encounter["enemy_id"], enemy_data)
 
                 # Offer Fight / Flee choice instead of full controls
                 choice_view = ScoutEncounterView(self.player, enemy_instance, self.bot, encounter["enemy_id"])
@@ -797,9 +741,6 @@ class ActivitySelectionView(discord.ui.View):
         else:
             # Regular activity - handle foraging minigame
             if activity.lower() == "foraging":
-                # Start foraging minigame
-                from .foraging_minigame import ForagingMinigameView
-
                 # Create minigame view
                 minigame_view = ForagingMinigameView(
                     self.player, self.bot, activity_data
@@ -841,7 +782,7 @@ class ActivitySelectionView(discord.ui.View):
             )
 
         # Add continue button
-        view = CharacterActionView(self.player, self.bot)
+        view = CharacterActionView.for_message(self.bot)
 
         embed.set_footer(text="Choose your next action!")
 
@@ -858,10 +799,17 @@ class PlayerCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_app_command_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ):
+        """Handle errors raised by this cog's slash commands"""
+        await ResponseUtils.send_command_error(interaction, error)
+
     @app_commands.command(
         name="create_character",
         description="Create a new character with interactive UI",
     )
+    @app_commands.checks.cooldown(1, 3.0)
     async def create_character(self, interaction: discord.Interaction):
         """Create a new character using a modal"""
         user_id = interaction.user.id
@@ -873,41 +821,41 @@ class PlayerCog(commands.Cog):
             )
             return
 
+        # Only one creation modal per user at a time
+        if user_id in self.bot.pending_creations:
+            await interaction.response.send_message(
+                f"{Emojis.ERROR} You already have a character creation form open! Submit it or wait for it to expire.",
+                ephemeral=True,
+            )
+            return
+
         # Show character creation modal
-        modal = CharacterCreationModal(self.bot)
-        await interaction.response.send_modal(modal)
+        modal = CharacterCreationModal(self.bot, user_id)
+        self.bot.pending_creations.add(user_id)
+        try:
+            await interaction.response.send_modal(modal)
+        except discord.HTTPException:
+            self.bot.pending_creations.discard(user_id)
+            raise
 
     @app_commands.command(
         name="character",
         description="View your character's stats with interactive buttons",
     )
-    async def character(self, interaction: discord.Interaction):
+    @requires_character
+    async def character(self, interaction: discord.Interaction, player):
         """View character information with action buttons"""
-        user_id = interaction.user.id
-        player = self.bot.get_player(user_id)
-
-        if not player:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} You don't have a character yet! Use `/create_character` to create one.",
-            )
-            return
-
         # Character summary embed without equipment
         embed = EmbedUtils.create_character_summary_embed(player)
-        view = CharacterSummaryView(player, self.bot)
+        view = CharacterSummaryView.for_message(self.bot)
         await interaction.response.send_message(embed=embed, view=view)
 
     @app_commands.command(
         name="inventory", description="View your inventory and inspect items"
     )
-    async def inventory(self, interaction: discord.Interaction):
+    @requires_character
+    async def inventory(self, interaction: discord.Interaction, player):
         """View inventory contents with inspect functionality"""
-        user_id = interaction.user.id
-        player, error_msg = PlayerUtils.get_player_or_error(self.bot, user_id)
-        if not player:
-            await ResponseUtils.send_error(interaction, error_msg, "No Character")
-            return
-
         # Create inventory embed
         embed = EmbedUtils.create_inventory_embed(player)
         view = InventoryView(player, self.bot)
@@ -918,3 +866,7 @@ class PlayerCog(commands.Cog):
 async def setup(bot):
     """Load the player cog"""
     await bot.add_cog(PlayerCog(bot))
+    # Persistent views keep their buttons working across restarts. They hold no
+    # per-player state, so one registered instance of each serves every message.
+    bot.add_view(CharacterActionView(bot))
+    bot.add_view(CharacterSummaryView(bot))
@@ -4,12 +4,13 @@ Bot utility functions and helpers
 
 from .embed_utils import EmbedUtils
 from .response_utils import ResponseUtils
-from .player_utils import PlayerUtils
+from .player_utils import PlayerUtils, requires_character
 from .emoji_constants import Emojis
 
 __all__ = [
     'EmbedUtils',
     'ResponseUtils', 
     'PlayerUtils',
+    'requires_character',
     'Emojis'
 ]
@@ -3,34 +3,108 @@ Shared embed creation utilities to reduce code duplication
 """
 
 import discord
+import functools
 import re
 from typing import Optional, Dict, Any, List
 
-from src.game.enums import StatType
+from src.game.enums import StatType, EquipmentSlot, PlayerClass, ItemType
+from src.game.utils.stat_utils import StatUtils
 from ...utils.ui_emojis import UIEmojis
 
+_CHARACTER_COLOR = discord.Color.blue().value
+
+_CHARACTER_STATS_TEMPLATE = (
+    "**Health:** {health}/{max_health} ({health_pct:.1f}%)\n"
+    "**Energy:** {energy}/{max_energy} ({energy_pct:.1f}%)\n"
+    "**Attack:** {attack}\n"
+    "**Defense:** {defense}\n"
+    "**Speed:** {speed}"
+)
+
+_SUMMARY_STATS_TEMPLATE = (
+    "Health: {health}/{max_health}\n"
+    "Energy: {energy}/{max_energy}\n"
+    "Attack: {attack}\n"
+    "Defense: {defense}\n"
+    "Speed: {speed}"
+)
+
+_CHARACTER_TITLE_EMOJI = UIEmojis.get_ui("character")
+
+# Field names on the full character embed
+_CHARACTER_FIELD_NAMES = {
+    "stats": f"{UIEmojis.get_ui('stats')} Stats",
+    "equipment": f"{UIEmojis.get_ui('equipment')} Equipment",
+    "resources": f"{UIEmojis.get_ui('gold')} Resources",
+    "location": f"{UIEmojis.get_ui('location')} Location",
+}
+
+# Stats read for character embeds; their values double as the template keys above
+_EMBED_STATS = (
+    StatType.HEALTH,
+    StatType.MAX_HEALTH,
+    StatType.ENERGY,
+    StatType.MAX_ENERGY,
+    StatType.ATTACK,
+    StatType.DEFENSE,
+    StatType.SPEED,
+)
+
+# Display names for enum values shown on every character and inventory embed
+_CLASS_NAMES = {player_class: player_class.value.title() for player_class in PlayerClass}
+_ITEM_TYPE_FIELD_NAMES = {
+    item_type: f"{UIEmojis.get_item_type(item_type.value)} {item_type.value.title()}"
+    for item_type in ItemType
+}
+
+# Custom emoji markdown, <:name:id>; only the id is needed for the CDN url
+_EMOJI_RE = re.compile(r"<:\w+:(\d+)>")
+
+# "**Main Hand:**" style labels for each equipment slot
+_SLOT_LABELS = {slot: f"**{slot.value.replace('_', ' ').title()}:**" for slot in EquipmentSlot}
+
+
+def _read_stats(player) -> Dict[str, int]:
+    """Read the stats shown on character embeds into a template-ready dict"""
+    return {stat.value: value for stat, value in player.get_stats(_EMBED_STATS).items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _region_title(region_id: str) -> str:
+    """Region id as shown on embeds, e.g. "grasslands" -> "Grasslands" """
+    return region_id.title()
+
+
+def _equipment_text(player) -> str:
+    """One line per equipment slot with the equipped item's name"""
+    return "\n".join(
+        f"{_SLOT_LABELS[slot]} {item.name if item else 'Empty'}"
+        for slot, item in player.equipment.equipped_items.items()
+    )
+
 
 class EmbedUtils:
     """Utility class for creating common Discord embeds"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def emoji_to_url(emoji: str) -> Optional[str]:
         """
         Convert Discord emoji markdown to proper URL format.
         Converts <:name:id> to https://cdn.discordapp.com/emojis/id.webp
+        Results are cached since the game only uses a small, fixed set of emojis.
         """
         if not emoji or not isinstance(emoji, str):
             return None
 
         # Check if it's already a URL
-        if emoji.startswith("http"):
+        if emoji[:4] == "http":
             return emoji
 
         # Check if it's a Discord emoji markdown
-        match = re.match(r"<:(\w+):(\d+)>", emoji)
+        match = _EMOJI_RE.match(emoji)
         if match:
-            emoji_id = match.group(2)
-            return f"https://cdn.discordapp.com/emojis/{emoji_id}.webp"
+            return f"https://cdn.discordapp.com/emojis/{match.group(1)}.webp"
 
         # If it's a Unicode emoji, return None (can't be used as thumbnail)
         return None
@@ -66,95 +140,49 @@ class EmbedUtils:
     def create_character_embed(player) -> discord.Embed:
         """Create a character information embed"""
         class_emoji = UIEmojis.get_player_class(player.player_class.value)
-        embed = discord.Embed(
-            title=f"{UIEmojis.get_ui('character')} {player.name} - Level {player.level} {class_emoji} {player.player_class.value.title()}",
-            color=discord.Color.blue(),
-        )
 
         # Stats section
-        stats_text = f"""
-**Health:** {player.get_stat('health')}/{player.get_stat('max_health')} ({player.get_health_percentage():.1f}%)
-**Mana:** {player.get_stat('mana')}/{player.get_stat('max_mana')} ({player.get_mana_percentage():.1f}%)
-**Attack:** {player.get_stat('attack')}
-**Defense:** {player.get_stat('defense')}
-**Speed:** {player.get_stat('speed')}
-        """.strip()
-
-        embed.add_field(
-            name=f"{UIEmojis.get_ui('stats')} Stats", value=stats_text, inline=True
-        )
-
-        # Equipment section
-        equipment_text = ""
-        for slot, item in player.equipment.equipped_items.items():
-            slot_name = slot.value.replace("_", " ").title()
-            equipment_text += f"**{slot_name}:** {item.name if item else 'Empty'}\n"
-
-        embed.add_field(
-            name=f"{UIEmojis.get_ui('equipment')} Equipment",
-            value=equipment_text,
-            inline=False,
-        )
-
-        # Resources
-        info_text = f"**Gold:** {player.gold}\n**Skill Points:** {player.skill_points}"
-        embed.add_field(
-            name=f"{UIEmojis.get_ui('gold')} Resources", value=info_text, inline=True
-        )
-
-        # Location
-        embed.add_field(
-            name=f"{UIEmojis.get_ui('location')} Location",
-            value=f"**{player.current_region.title()}**",
-            inline=True,
-        )
-
-        return embed
+        stats = _read_stats(player)
+        stats["health_pct"] = StatUtils.calculate_percentage(stats["health"], stats["max_health"])
+        stats["energy_pct"] = StatUtils.calculate_percentage(stats["energy"], stats["max_energy"])
+
+        # Build the whole embed in one go rather than field by field
+        return discord.Embed.from_dict({
+            "title": f"{_CHARACTER_TITLE_EMOJI} {player.name} - Level {player.level} {class_emoji} {_CLASS_NAMES[player.player_class]}",
+            "color": _CHARACTER_COLOR,
+            "fields": [
+                {"name": _CHARACTER_FIELD_NAMES["stats"], "value": _CHARACTER_STATS_TEMPLATE.format_map(stats), "inline": True},
+                {"name": _CHARACTER_FIELD_NAMES["equipment"], "value": _equipment_text(player), "inline": False},
+                {"name": _CHARACTER_FIELD_NAMES["resources"], "value": f"**Gold:** {player.gold}\n**Skill Points:** {player.skill_points}", "inline": True},
+                {"name": _CHARACTER_FIELD_NAMES["location"], "value": f"**{_region_title(player.current_region)}**", "inline": True},
+            ],
+        })
 
     @staticmethod
     def create_character_summary_embed(player) -> discord.Embed:
         """Create a concise character summary embed (no equipment)."""
-
-        embed = discord.Embed(title=f"Character Summary", color=discord.Color.blue())
+        stats_text = _SUMMARY_STATS_TEMPLATE.format_map(_read_stats(player))
+
+        # Build the whole embed in one go rather than field by field
+        embed_data = {
+            "title": "Character Summary",
+            "color": _CHARACTER_COLOR,
+            "fields": [
+                {"name": "Name", "value": player.name, "inline": True},
+                {"name": "Class", "value": f"{_CLASS_NAMES[player.player_class]} (Level {player.level})", "inline": True},
+                {"name": "\u200b", "value": "\u200b", "inline": True},
+                {"name": "Resources", "value": f"Gold: {player.gold}\nSkill Points: {player.skill_points}", "inline": True},
+                {"name": "Stats", "value": stats_text, "inline": True},
+                {"name": "\u200b", "value": "\u200b", "inline": True},
+            ],
+        }
 
         # Class emoji as thumbnail
-        class_emoji = UIEmojis.get_player_class(player.player_class.value)
-        class_emoji_url = EmbedUtils.emoji_to_url(class_emoji)
+        class_emoji_url = EmbedUtils.emoji_to_url(UIEmojis.get_player_class(player.player_class.value))
         if class_emoji_url:
-            embed.set_thumbnail(url=class_emoji_url)
-
-        # Name text
-        name_text = f"{player.name}"
-        embed.add_field(name="Name", value=name_text, inline=True)
-
-        # Class text
-        class_text = f"{player.player_class.value.title()} (Level {player.level})"
-        embed.add_field(name="Class", value=class_text, inline=True)
-
-        # Empty Line
-        embed.add_field(name="\u200b", value="\u200b")
-
-        # Resources
-        resources_text = f"""
-Gold: {player.gold}
-Skill Points: {player.skill_points}
-        """.strip()
-        embed.add_field(name="Resources", value=resources_text, inline=True)
-
-        # Stats
-        stats_text = f"""
-Health: {player.get_stat(StatType.HEALTH)}/{player.get_stat(StatType.MAX_HEALTH)}
-Energy: {player.get_stat(StatType.ENERGY)}/{player.get_stat(StatType.MAX_ENERGY)}
-Attack: {player.get_stat(StatType.ATTACK)}
-Defense: {player.get_stat(StatType.DEFENSE)}
-Speed: {player.get_stat(StatType.SPEED)}
-        """.strip()
-        embed.add_field(name="Stats", value=stats_text, inline=True)
-
-        # Empty Line
-        embed.add_field(name="\u200b", value="\u200b")
+            embed_data["thumbnail"] = {"url": class_emoji_url}
 
-        return embed
+        return discord.Embed.from_dict(embed_data)
 
     @staticmethod
     def create_equipment_embed(player) -> discord.Embed:
@@ -169,17 +197,11 @@ Speed: {player.get_stat(StatType.SPEED)}
         if equipment_emoji_url:
             embed.set_thumbnail(url=equipment_emoji_url)
 
-        equipment_text = ""
-        for slot, item in player.equipment.equipped_items.items():
-            slot_name = slot.value.replace("_", " ").title()
-            equipment_text += f"**{slot_name}:** {item.name if item else 'Empty'}\n"
-
-        if not equipment_text:
-            equipment_text = "No equipment."
+        equipment_text = _equipment_text(player) or "No equipment."
 
         embed.add_field(
             name=f"{UIEmojis.get_ui('equipment')} Equipment",
-            value=equipment_text.strip(),
+            value=equipment_text,
             inline=False,
         )
 
@@ -207,20 +229,20 @@ Speed: {player.get_stat(StatType.SPEED)}
             # Group items by type
             items_by_type = {}
             for item_name, item in inventory_items.items():
-                item_type = item.item_type.value.title()
+                item_type = item.item_type
                 if item_type not in items_by_type:
                     items_by_type[item_type] = []
                 items_by_type[item_type].append((item, item.quantity))
 
             # Display items by type
             for item_type, items in items_by_type.items():
-                item_text = ""
-                for item, quantity in items:
-                    item_text += f"{item.emoji} **{item.name}** x{quantity}\n"
+                item_text = "\n".join(
+                    [f"{item.emoji} **{item.name}** x{quantity}" for item, quantity in items]
+                )
 
                 embed.add_field(
-                    name=f"{UIEmojis.get_item_type(item_type.lower())} {item_type}",
-                    value=item_text.strip(),
+                    name=_ITEM_TYPE_FIELD_NAMES[item_type],
+                    value=item_text,
                     inline=True,
                 )
 
@@ -244,14 +266,11 @@ Speed: {player.get_stat(StatType.SPEED)}
         )
 
         # Available activities
-        activities = region.available_activities
-        if activities:
-            activity_text = "\n".join(
-                [f"• {activity.title()}" for activity in activities]
-            )
+        activity_lines = region.activity_display_lines
+        if activity_lines:
             embed.add_field(
                 name=f"{UIEmojis.get_ui('explore')} Available Activities",
-                value=activity_text,
+                value="\n".join(activity_lines),
                 inline=True,
             )
 
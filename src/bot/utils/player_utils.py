@@ -3,8 +3,37 @@ Shared player validation utilities to reduce code duplication
 """
 
 import discord
+import functools
+import inspect
 from typing import Optional, Tuple
 from ...game.entities.player import Player
+from .embed_utils import EmbedUtils
+
+_NO_CHARACTER_MESSAGE = "You don't have a character yet! Use `/create_character` to create one."
+
+# Shared by every command guarded with requires_character, never mutated
+_NO_CHARACTER_EMBED = EmbedUtils.create_error_embed(_NO_CHARACTER_MESSAGE, "No Character")
+
+
+def requires_character(func):
+    """
+    Decorator for cog slash commands and persistent view buttons that need the
+    caller's character. Looks up the player and passes it after the interaction,
+    or replies with the shared "No Character" embed if there isn't one.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+        player = self.bot.get_player(interaction.user.id)
+        if not player:
+            await interaction.response.send_message(embed=_NO_CHARACTER_EMBED, ephemeral=True)
+            return
+        return await func(self, interaction, player, *args, **kwargs)
+    
+    # Hide the injected player parameter from discord.py's option parsing
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    wrapper.__signature__ = signature.replace(parameters=parameters[:2] + parameters[3:])
+    return wrapper
 
 
 class PlayerUtils:
@@ -20,7 +49,7 @@ class PlayerUtils:
         """
         player = bot.get_player(user_id)
         if not player:
-            return None, "You don't have a character yet! Use `/create_character` to create one."
+            return None, _NO_CHARACTER_MESSAGE
         return player, None
     
     @staticmethod
@@ -33,7 +62,7 @@ class PlayerUtils:
         """
         player = bot.get_player(user_id)
         if not player:
-            return None, "You don't have a character yet! Use `/create_character` to create one."
+            return None, _NO_CHARACTER_MESSAGE
         return player, None
     
     @staticmethod
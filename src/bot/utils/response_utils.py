@@ -3,9 +3,13 @@ Shared response utilities to reduce code duplication
 """
 
 import discord
+from discord import app_commands
 from typing import Optional
 from .embed_utils import EmbedUtils
 
+# Shown when PocketRPG.begin_user_action refuses a user who already has an action running
+_BUSY_MESSAGE = "You're already in the middle of something! Wait for it to finish first."
+
 
 class ResponseUtils:
     """Utility class for common Discord response patterns"""
@@ -37,6 +41,19 @@ class ResponseUtils:
         else:
             await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
     
+    @staticmethod
+    async def send_busy(interaction: discord.Interaction):
+        """Tell a user their previous command is still in progress"""
+        await ResponseUtils.send_error(interaction, _BUSY_MESSAGE, "Busy")
+    
+    @staticmethod
+    async def send_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Send the standard response for a slash command error, if it has one"""
+        if isinstance(error, app_commands.CommandOnCooldown):
+            await ResponseUtils.send_error(
+                interaction, f"You're doing that too fast! Try again in {error.retry_after:.1f} seconds.", "On Cooldown"
+            )
+    
     @staticmethod
     async def send_embed(interaction: discord.Interaction, embed: discord.Embed, ephemeral: bool = False):
         """Send an embed response"""
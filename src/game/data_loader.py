@@ -5,9 +5,24 @@ Handles loading of regions, activities, items, and enemies from JSON files
 
 import json
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+# orjson parses noticeably faster; fall back to the standard library without it.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_json_file(file_path: Path) -> Any:
+    """Parse a UTF-8 JSON file"""
+    raw = file_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class DataLoader:
     """
@@ -19,155 +34,127 @@ class DataLoader:
         self.data_path = Path(data_path)
         self._cache = {}
     
-    def load_region(self, region_id: str) -> Optional[Dict[str, Any]]:
-        """Load a region by ID"""
-        if region_id in self._cache.get('regions', {}):
-            return self._cache['regions'][region_id]
+    def _load(self, category: str, file_id: str) -> Optional[Dict[str, Any]]:
+        """Load one JSON file from a data subdirectory, caching it by ID"""
+        cache = self._cache.get(category)
+        if cache is not None and file_id in cache:
+            return cache[file_id]
         
-        file_path = self.data_path / "regions" / f"{region_id}.json"
+        file_path = self.data_path / category / f"{file_id}.json"
         if not file_path.exists():
             return None
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Cache the data
-            if 'regions' not in self._cache:
-                self._cache['regions'] = {}
-            self._cache['regions'][region_id] = data
-            
-            return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading region {region_id}: {e}")
-            return None
+        data = self._read_json(file_path)
+        if data is not None:
+            self._cache.setdefault(category, {})[file_id] = data
+        return data
+    
+    def load_region(self, region_id: str) -> Optional[Dict[str, Any]]:
+        """Load a region by ID"""
+        return self._load('regions', region_id)
     
     def load_activity(self, activity_id: str) -> Optional[Dict[str, Any]]:
         """Load an activity by ID"""
-        if activity_id in self._cache.get('activities', {}):
-            return self._cache['activities'][activity_id]
-        
-        file_path = self.data_path / "activities" / f"{activity_id}.json"
-        if not file_path.exists():
-            return None
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Cache the data
-            if 'activities' not in self._cache:
-                self._cache['activities'] = {}
-            self._cache['activities'][activity_id] = data
-            
-            return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading activity {activity_id}: {e}")
-            return None
+        return self._load('activities', activity_id)
     
     def load_item(self, item_id: str) -> Optional[Dict[str, Any]]:
         """Load an item by ID"""
-        if item_id in self._cache.get('items', {}):
-            return self._cache['items'][item_id]
-        
-        file_path = self.data_path / "items" / f"{item_id}.json"
-        if not file_path.exists():
-            return None
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Cache the data
-            if 'items' not in self._cache:
-                self._cache['items'] = {}
-            self._cache['items'][item_id] = data
-            
-            return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading item {item_id}: {e}")
-            return None
+        return self._load('items', item_id)
     
     def load_enemy(self, enemy_id: str) -> Optional[Dict[str, Any]]:
         """Load an enemy by ID"""
-        if enemy_id in self._cache.get('enemies', {}):
-            return self._cache['enemies'][enemy_id]
-        
-        file_path = self.data_path / "enemies" / f"{enemy_id}.json"
-        if not file_path.exists():
-            return None
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Cache the data
-            if 'enemies' not in self._cache:
-                self._cache['enemies'] = {}
-            self._cache['enemies'][enemy_id] = data
-            
-            return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading enemy {enemy_id}: {e}")
-            return None
+        return self._load('enemies', enemy_id)
+    
+    def get_loaded(self, category: str) -> Dict[str, Dict[str, Any]]:
+        """Copy of everything cached for a category ('regions', 'activities', 'items' or 'enemies')"""
+        return dict(self._cache.get(category, {}))
+    
+    def _list_ids(self, category: str) -> Tuple[str, ...]:
+        """IDs of the JSON files in a data subdirectory, scanned once until the cache is cleared"""
+        listings = self._cache.setdefault('listings', {})
+        if category not in listings:
+            category_dir = self.data_path / category
+            if category_dir.exists():
+                with os.scandir(category_dir) as entries:
+                    listings[category] = tuple(
+                        entry.name[:-5] for entry in entries
+                        if entry.is_file() and entry.name.endswith('.json')
+                    )
+            else:
+                listings[category] = ()
+        return listings[category]
     
     def list_regions(self) -> List[str]:
         """List all available region IDs"""
-        regions_dir = self.data_path / "regions"
-        if not regions_dir.exists():
-            return []
-        
-        return [f.stem for f in regions_dir.glob("*.json")]
+        return list(self._list_ids('regions'))
     
     def list_activities(self) -> List[str]:
         """List all available activity IDs"""
-        activities_dir = self.data_path / "activities"
-        if not activities_dir.exists():
-            return []
-        
-        return [f.stem for f in activities_dir.glob("*.json")]
+        return list(self._list_ids('activities'))
     
     def list_items(self) -> List[str]:
         """List all available item IDs"""
-        items_dir = self.data_path / "items"
-        if not items_dir.exists():
-            return []
-        
-        return [f.stem for f in items_dir.glob("*.json")]
+        return list(self._list_ids('items'))
     
     def list_enemies(self) -> List[str]:
         """List all available enemy IDs"""
-        enemies_dir = self.data_path / "enemies"
-        if not enemies_dir.exists():
-            return []
-        
-        return [f.stem for f in enemies_dir.glob("*.json")]
+        return list(self._list_ids('enemies'))
     
     def get_enemies_for_region(self, region_id: str) -> List[str]:
         """Get all enemies that can spawn in a specific region"""
-        enemies = []
-        for enemy_id in self.list_enemies():
-            enemy_data = self.load_enemy(enemy_id)
-            if enemy_data and region_id in enemy_data.get('spawn_regions', []):
-                enemies.append(enemy_id)
-        return enemies
+        region_enemies = self._cache.get('region_enemies')
+        if region_enemies is None:
+            # Index every region in one pass over the enemies
+            region_enemies = {}
+            for enemy_id in self._list_ids('enemies'):
+                enemy_data = self.load_enemy(enemy_id)
+                if enemy_data:
+                    for spawn_region in enemy_data.get('spawn_regions', []):
+                        region_enemies.setdefault(spawn_region, []).append(enemy_id)
+            self._cache['region_enemies'] = region_enemies
+        
+        return list(region_enemies.get(region_id, ()))
     
     def clear_cache(self):
         """Clear the data cache"""
         self._cache.clear()
     
+    @staticmethod
+    def _read_json(file_path: Path) -> Optional[Dict[str, Any]]:
+        """Read one JSON file, returning None if it can't be loaded"""
+        try:
+            return _parse_json_file(file_path)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+    
+    def _bulk_load(self, category: str):
+        """Load every JSON file in a data subdirectory into the cache in one pass"""
+        category_dir = self.data_path / category
+        loaded = {}
+        # Read serially: the files are small and already page-cached, so a thread
+        # pool costs more to start than it saves (reload_data runs off the event loop)
+        for file_id in self._list_ids(category):
+            data = self._read_json(category_dir / f"{file_id}.json")
+            if data is not None:
+                loaded[file_id] = data
+        
+        if loaded:
+            self._cache.setdefault(category, {}).update(loaded)
+    
     def reload_data(self):
-        """Reload all data from files"""
-        self.clear_cache()
-        # Preload some common data
-        for region_id in self.list_regions():
-            self.load_region(region_id)
-        for activity_id in self.list_activities():
-            self.load_activity(activity_id)
-        for item_id in self.list_items():
-            self.load_item(item_id)
-        for enemy_id in self.list_enemies():
-            self.load_enemy(enemy_id)
+        """
+        Reload all data from files.
+        The new data is loaded into a separate loader and swapped in with one assignment,
+        so readers on other threads see either the old cache or the complete new one.
+        """
+        fresh = DataLoader(self.data_path)
+        # Preload every data file, one pass per category
+        for category in ('regions', 'activities', 'items', 'enemies'):
+            fresh._bulk_load(category)
+        for region_id in fresh._list_ids('regions'):
+            fresh.get_enemies_for_region(region_id)
+        self._cache = fresh._cache
 
 
 # Global data loader instance
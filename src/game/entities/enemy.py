@@ -3,10 +3,48 @@ Enemy class for AI-controlled opponents in the RPG
 Inherits from Entity and adds enemy-specific functionality
 """
 
+import copy
+import random
+import uuid
 from typing import Dict, List, Optional, Any, Tuple
 from .entity import Entity, EntityType, StatType
 from ..enums import EnemyType, EnemyBehavior
 
+# Stat bonuses applied on top of the base enemy stats, by enemy type
+_TYPE_STAT_BONUSES = {
+    EnemyType.NORMAL: {
+        StatType.HEALTH: 0,
+        StatType.ATTACK: 0,
+        StatType.DEFENSE: 0
+    },
+    EnemyType.ELITE: {
+        StatType.HEALTH: 50,
+        StatType.ATTACK: 5,
+        StatType.DEFENSE: 3,
+        StatType.SPEED: 2
+    },
+    EnemyType.MINIBOSS: {
+        StatType.HEALTH: 100,
+        StatType.ATTACK: 8,
+        StatType.DEFENSE: 5,
+        StatType.SPEED: 3
+    },
+    EnemyType.BOSS: {
+        StatType.HEALTH: 200,
+        StatType.ATTACK: 15,
+        StatType.DEFENSE: 10,
+        StatType.SPEED: 5
+    }
+}
+
+# (experience, gold) reward multipliers by enemy type
+_TYPE_REWARD_MULTIPLIERS = {
+    EnemyType.NORMAL: (1.0, 1.0),
+    EnemyType.ELITE: (1.5, 1.5),
+    EnemyType.MINIBOSS: (2.0, 2.0),
+    EnemyType.BOSS: (3.0, 3.0)
+}
+
 
 class Enemy(Entity):
     """
@@ -52,34 +90,8 @@ class Enemy(Entity):
     
     def _initialize_enemy_stats(self) -> None:
         """Initialize enemy-specific stat bonuses based on type"""
-        type_bonuses = {
-            EnemyType.NORMAL: {
-                StatType.HEALTH: 0,
-                StatType.ATTACK: 0,
-                StatType.DEFENSE: 0
-            },
-            EnemyType.ELITE: {
-                StatType.HEALTH: 50,
-                StatType.ATTACK: 5,
-                StatType.DEFENSE: 3,
-                StatType.SPEED: 2
-            },
-            EnemyType.MINIBOSS: {
-                StatType.HEALTH: 100,
-                StatType.ATTACK: 8,
-                StatType.DEFENSE: 5,
-                StatType.SPEED: 3
-            },
-            EnemyType.BOSS: {
-                StatType.HEALTH: 200,
-                StatType.ATTACK: 15,
-                StatType.DEFENSE: 10,
-                StatType.SPEED: 5
-            }
-        }
-        
         # Apply type bonuses
-        bonuses = type_bonuses.get(self.enemy_type, {})
+        bonuses = _TYPE_STAT_BONUSES.get(self.enemy_type, {})
         for stat, bonus in bonuses.items():
             current_value = self.get_stat(stat)
             self.set_stat(stat, current_value + bonus)
@@ -92,14 +104,7 @@ class Enemy(Entity):
         base_exp = self.level * 10
         base_gold = self.level * 5
         
-        type_multipliers = {
-            EnemyType.NORMAL: (1.0, 1.0),
-            EnemyType.ELITE: (1.5, 1.5),
-            EnemyType.MINIBOSS: (2.0, 2.0),
-            EnemyType.BOSS: (3.0, 3.0)
-        }
-        
-        exp_mult, gold_mult = type_multipliers.get(self.enemy_type, (1.0, 1.0))
+        exp_mult, gold_mult = _TYPE_REWARD_MULTIPLIERS.get(self.enemy_type, (1.0, 1.0))
         self.experience_reward = int(base_exp * exp_mult)
         self.gold_reward = int(base_gold * gold_mult)
     
@@ -127,7 +132,6 @@ class Enemy(Entity):
     
     def generate_loot(self) -> List[Dict[str, Any]]:
         """Generate loot drops based on loot table"""
-        import random
         dropped_items = []
         
         for loot_entry in self.loot_table:
@@ -225,8 +229,6 @@ class Enemy(Entity):
     
     def _balanced_ai(self, target: Entity, actions: List[str]) -> str:
         """AI behavior for balanced enemies"""
-        import random
-        
         # Heal if very low health
         if self.get_health_percentage() < 25 and "heal" in actions:
             return "heal"
@@ -283,6 +285,17 @@ class Enemy(Entity):
         
         return f"{type_desc}. {behavior_desc}"
     
+    def clone(self) -> 'Enemy':
+        """Create a fresh copy of this enemy with its own id and combat state"""
+        enemy = copy.copy(self)
+        enemy.id = str(uuid.uuid4())
+        enemy.stats = dict(self.stats)
+        enemy.status_effects = []
+        enemy.temporary_modifiers = dict(self.temporary_modifiers)
+        enemy.loot_table = list(self.loot_table)
+        enemy.ai_cooldowns = dict(self.ai_cooldowns)
+        return enemy
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert enemy to dictionary for serialization"""
         base_dict = super().to_dict()
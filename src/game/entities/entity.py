@@ -59,6 +59,15 @@ class Entity(ABC, SerializableMixin, StringRepresentationMixin):
         modifier = self.temporary_modifiers.get(stat_type, 0)
         return max(0, base_value + modifier)
     
+    def get_stats(self, stat_types) -> Dict[StatType, int]:
+        """Get several stat values including temporary modifiers in one pass"""
+        stats = self.stats
+        modifiers = self.temporary_modifiers
+        return {
+            stat_type: max(0, stats.get(stat_type, 0) + modifiers.get(stat_type, 0))
+            for stat_type in stat_types
+        }
+    
     def set_stat(self, stat_type: StatType, value: int) -> None:
         """Set a stat value"""
         self.stats[stat_type] = max(0, value)
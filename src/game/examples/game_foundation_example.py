@@ -5,7 +5,7 @@ Shows player creation, region system, and data loading
 
 from ..player_creation import PlayerCreation
 from ..region import Region, RegionManager
-from ..enums import PlayerClass
+from ..enums import PlayerClass, EquipmentSlot
 from ..data_loader import data_loader
 
 
@@ -20,7 +20,7 @@ def demonstrate_player_creation():
     print(f"Player class: {player.player_class.value}")
     print(f"Starting region: {player.current_region}")
     print(f"Starting gold: {player.gold}")
-    print(f"Equipped weapon: {player.equipment.get_equipped_item(player.equipment.equipped_items.keys().__iter__().__next__())}")
+    print(f"Equipped weapon: {player.equipment.get_equipped_item(EquipmentSlot.MAIN_HAND)}")
     print()
     
     return player
@@ -99,11 +99,7 @@ def demonstrate_integration():
     print(f"Enemies in this region: {available_enemies}")
     
     # Show player's starting equipment
-    equipped_weapon = None
-    for slot, item in player.equipment.equipped_items.items():
-        if item is not None:
-            equipped_weapon = item
-            break
+    equipped_weapon = player.equipment.get_equipped_item(EquipmentSlot.MAIN_HAND)
     
     if equipped_weapon:
         print(f"Starting weapon: {equipped_weapon.name} (Damage: {equipped_weapon.damage})")
@@ -3,8 +3,10 @@ Inventory system for managing player items
 Handles item storage, stacking, and basic operations
 """
 
+import copy
 from typing import Dict, List, Optional, Any
 from .item import Item
+from ..enums import ItemType, ItemRarity
 
 
 class Inventory:
@@ -17,6 +19,7 @@ class Inventory:
         self.max_capacity: int = max_capacity
         self.items: Dict[str, Item] = {}  # item_name -> Item
         self.item_order: List[str] = []  # Maintain order of items
+        self.revision: int = 0  # Bumped on every change, lets UI code reuse renders of unchanged inventories
     
     def add_item(self, item: Item, quantity: int = 1) -> bool:
         """
@@ -35,11 +38,13 @@ class Inventory:
             existing_item = self.items[item.name]
             if existing_item.quantity + quantity <= existing_item.max_stack:
                 existing_item.quantity += quantity
+                self.revision += 1
                 return True
             else:
                 # Partial stack, add what we can
                 can_add = existing_item.max_stack - existing_item.quantity
                 existing_item.quantity = existing_item.max_stack
+                self.revision += 1
                 return self.add_item(item, quantity - can_add)
         
         # Add new item
@@ -47,6 +52,7 @@ class Inventory:
         new_item.quantity = quantity
         self.items[item.name] = new_item
         self.item_order.append(item.name)
+        self.revision += 1
         
         return True
     
@@ -64,6 +70,7 @@ class Inventory:
             return False
         
         item.quantity -= quantity
+        self.revision += 1
         
         # Remove item if quantity reaches 0
         if item.quantity <= 0:
@@ -99,12 +106,10 @@ class Inventory:
     
     def get_consumables(self) -> List[Item]:
         """Get all consumable items"""
-        from .item import ItemType
         return self.get_items_by_type(ItemType.CONSUMABLE)
     
     def get_equipment(self) -> List[Item]:
         """Get all equipment items"""
-        from .item import ItemType
         equipment_types = [ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY]
         return [item for item in self.get_all_items() if item.item_type in equipment_types]
     
@@ -120,6 +125,7 @@ class Inventory:
         
         # Use the item
         success = item.use(user)
+        self.revision += 1
         
         # Remove item if it was consumed
         if success and item.item_type.value == "consumable":
@@ -171,7 +177,6 @@ class Inventory:
         """Create a copy of an item"""
         # This is a simplified copy method
         # In a real implementation, you might want to use deepcopy or implement __copy__
-        import copy
         return copy.deepcopy(item)
     
     def sort_items(self, sort_by: str = "name") -> None:
@@ -181,16 +186,17 @@ class Inventory:
         elif sort_by == "type":
             self.item_order.sort(key=lambda name: self.items[name].item_type.value)
         elif sort_by == "rarity":
-            from .item import ItemRarity
             rarity_order = {rarity: i for i, rarity in enumerate(ItemRarity)}
             self.item_order.sort(key=lambda name: rarity_order.get(self.items[name].rarity, 0))
         elif sort_by == "value":
             self.item_order.sort(key=lambda name: self.items[name].value, reverse=True)
+        self.revision += 1
     
     def clear(self) -> None:
         """Clear all items from the inventory"""
         self.items.clear()
         self.item_order.clear()
+        self.revision += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert inventory to dictionary for serialization"""
@@ -205,6 +211,8 @@ class Inventory:
         self.max_capacity = data.get('max_capacity', 50)
         self.item_order = data.get('item_order', [])
         
+        self.revision += 1
+        
         # Recreate items from dictionary
         self.items = {}
         for name, item_data in data.get('items', {}).items():
@@ -5,7 +5,8 @@ Handles the initial player setup with default stats and starting equipment
 
 from typing import Optional
 from .entities.player import Player, PlayerClass
-from .enums import StatType, EquipmentSlot
+from .enums import StatType, EquipmentSlot, ItemRarity, ItemQuality
+from .items.item import WeaponItem
 from .data_loader import data_loader
 
 
@@ -53,9 +54,6 @@ class PlayerCreation:
         fists_data = data_loader.load_item("fists")
         if fists_data:
             # Create fists item from data
-            from .items.item import WeaponItem
-            from .enums import ItemRarity, ItemQuality
-            
             fists = WeaponItem(
                 name=fists_data["name"],
                 description=fists_data["description"],
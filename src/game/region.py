@@ -3,10 +3,18 @@ Region system for the game
 Handles regions, travel, and region-specific content
 """
 
+import random
 from typing import Dict, List, Optional, Any
 from .enums import StatType
 from .data_loader import data_loader
 
+# Encounter rates used when the scout activity data doesn't define its own
+_DEFAULT_ENCOUNTER_RATES = {
+    "normal": 0.6,
+    "mini_boss": 0.3,
+    "boss": 0.1
+}
+
 
 class Region:
     """
@@ -17,7 +25,13 @@ class Region:
         self.region_id: str = region_id
         self.data: Optional[Dict[str, Any]] = None
         self.data_loader = data_loader_instance or data_loader
+        self._enemy_display_lines: Optional[List[str]] = None
+        self._region_enemies: Optional[List[tuple]] = None
+        self._enemy_discovery_lines: Optional[List[tuple]] = None
         self._load_data()
+        self._activity_set = frozenset(activity.lower() for activity in self.available_activities)
+        self._activity_titles = {activity: activity.title() for activity in self.available_activities}
+        self._activity_display_lines = [f"• {title}" for title in self._activity_titles.values()]
     
     def _load_data(self) -> None:
         """Load region data from JSON file"""
@@ -55,6 +69,20 @@ class Region:
         """Get list of available activities in this region"""
         return self.data.get("available_activities", [])
     
+    def has_activity(self, activity: str) -> bool:
+        """Check if an activity is available in this region"""
+        return activity.lower() in self._activity_set
+    
+    @property
+    def activity_titles(self) -> Dict[str, str]:
+        """Get display titles for this region's activities, keyed by activity id"""
+        return self._activity_titles
+    
+    @property
+    def activity_display_lines(self) -> List[str]:
+        """Get "• Activity" lines for this region's activities"""
+        return self._activity_display_lines
+    
     def get_unlocked_activities(self, player) -> List[str]:
         """Get list of activities available to the player in this region"""
         region_activities = self.data.get("available_activities", [])
@@ -108,36 +136,62 @@ class Region:
     
     def get_available_enemies(self) -> List[str]:
         """Get list of enemies that can spawn in this region"""
-        return data_loader.get_enemies_for_region(self.region_id)
+        return self.data_loader.get_enemies_for_region(self.region_id)
+    
+    @property
+    def enemy_display_lines(self) -> List[str]:
+        """Get "• Name (Level N)" lines for this region's enemies, built once per region"""
+        if self._enemy_display_lines is None:
+            lines = []
+            for enemy_id in self.get_available_enemies():
+                enemy = self.data_loader.load_enemy(enemy_id)
+                if enemy:
+                    lines.append(f"• {enemy['name']} (Level {enemy['base_level']})")
+            self._enemy_display_lines = lines
+        return self._enemy_display_lines
+    
+    def _get_region_enemies(self) -> List[tuple]:
+        """Get (enemy_id, enemy_data) pairs for this region's listed enemies, built once per region"""
+        if self._region_enemies is None:
+            pairs = []
+            for enemy_id in self.data.get("enemies", []):
+                enemy_data = self.data_loader.load_enemy(enemy_id)
+                if enemy_data:
+                    pairs.append((enemy_id, enemy_data))
+            self._region_enemies = pairs
+        return self._region_enemies
     
     def get_enemies_with_discovery(self, player) -> List[Dict[str, Any]]:
         """Get enemies with discovery status for a player"""
         enemies = []
-        region_data = data_loader.load_region(self.region_id)
-        if not region_data:
-            return enemies
-        
-        enemy_ids = region_data.get("enemies", [])
-        for enemy_id in enemy_ids:
-            enemy_data = data_loader.load_enemy(enemy_id)
-            if enemy_data:
-                discovered = player.has_discovered_enemy(enemy_id)
-                enemies.append({
-                    "id": enemy_id,
-                    "name": enemy_data["name"] if discovered else "Unknown Enemy",
-                    "type": enemy_data["type"],
-                    "level": enemy_data["base_level"],
-                    "rarity": enemy_data.get("rarity", "common"),
-                    "discovered": discovered,
-                    "data": enemy_data if discovered else None
-                })
+        for enemy_id, enemy_data in self._get_region_enemies():
+            discovered = player.has_discovered_enemy(enemy_id)
+            enemies.append({
+                "id": enemy_id,
+                "name": enemy_data["name"] if discovered else "Unknown Enemy",
+                "type": enemy_data["type"],
+                "level": enemy_data["base_level"],
+                "rarity": enemy_data.get("rarity", "common"),
+                "discovered": discovered,
+                "data": enemy_data if discovered else None
+            })
         
         return enemies
     
+    def get_enemy_discovery_lines(self, player) -> List[str]:
+        """Get exploration lines for this region's enemies, hiding ones the player hasn't discovered"""
+        if self._enemy_discovery_lines is None:
+            self._enemy_discovery_lines = [
+                (enemy_id, f"{enemy_data.get('emoji', '👹')} {enemy_data['name']} (Level {enemy_data['base_level']})")
+                for enemy_id, enemy_data in self._get_region_enemies()
+            ]
+        return [
+            line if player.has_discovered_enemy(enemy_id) else "❓ Unknown Enemy"
+            for enemy_id, line in self._enemy_discovery_lines
+        ]
+    
     def get_scout_encounter(self, player) -> Optional[Dict[str, Any]]:
         """Get a random enemy encounter based on scout activity"""
-        import random
-        
         region_data = data_loader.load_region(self.region_id)
         if not region_data:
             return None
@@ -166,11 +220,7 @@ class Region:
                 enemies_by_type[enemy_type].append(enemy_data)
         
         # Use encounter rates to select enemy type
-        encounter_rates = scout_data.get("encounter_rates", {
-            "normal": 0.6,
-            "mini_boss": 0.3,
-            "boss": 0.1
-        })
+        encounter_rates = scout_data.get("encounter_rates", _DEFAULT_ENCOUNTER_RATES)
         
         # Weighted random selection
         rand = random.random()
@@ -219,6 +269,33 @@ class RegionManager:
     def __init__(self, data_loader_instance=None):
         self.current_region: Optional[Region] = None
         self.data_loader = data_loader_instance or data_loader
+        self._region_cache: Dict[str, Region] = {}
+        self._all_regions: Optional[List[Region]] = None
+    
+    def get_region(self, region_id: str) -> Region:
+        """
+        Get a region by ID, building it on first use.
+        
+        Raises:
+            ValueError: If the region does not exist
+        """
+        region = self._region_cache.get(region_id)
+        if region is None:
+            region = Region(region_id, self.data_loader)
+            self._region_cache[region_id] = region
+        return region
+    
+    def clear_region_cache(self) -> None:
+        """Drop cached regions so they are rebuilt from freshly loaded data"""
+        self._region_cache.clear()
+        self._all_regions = None
+        self.current_region = None
+    
+    def get_all_regions(self) -> List[Region]:
+        """Get every region, listing the regions directory only once"""
+        if self._all_regions is None:
+            self._all_regions = [self.get_region(region_id) for region_id in self.data_loader.list_regions()]
+        return self._all_regions
     
     def set_current_region(self, region_id: str) -> bool:
         """
@@ -231,7 +308,7 @@ class RegionManager:
             True if successful, False otherwise
         """
         try:
-            self.current_region = Region(region_id, self.data_loader)
+            self.current_region = self.get_region(region_id)
             return True
         except ValueError:
             return False
@@ -240,6 +317,21 @@ class RegionManager:
         """Get the current region"""
         return self.current_region
     
+    def get_player_region(self, player) -> Optional[Region]:
+        """
+        Get the region a player is in without touching the shared current region.
+        
+        Args:
+            player: Player instance
+            
+        Returns:
+            The player's Region, or None if it doesn't exist
+        """
+        try:
+            return self.get_region(player.current_region)
+        except ValueError:
+            return None
+    
     def get_available_regions(self) -> List[str]:
         """Get list of all available regions"""
         return self.data_loader.list_regions()
@@ -247,19 +339,17 @@ class RegionManager:
     def get_accessible_regions(self, player) -> List[Dict[str, Any]]:
         """Get regions accessible to a player with their status"""
         regions = []
-        all_regions = self.data_loader.list_regions()
         
-        for region_id in all_regions:
-            region = Region(region_id, self.data_loader)
+        for region in self.get_all_regions():
             can_access, reason = region.can_player_access(player)
             
             regions.append({
-                "id": region_id,
+                "id": region.region_id,
                 "name": region.name,
                 "level": region.level,
                 "accessible": can_access,
                 "reason": reason if not can_access else "",
-                "current": region_id == player.current_region
+                "current": region.region_id == player.current_region
             })
         
         return regions
@@ -276,7 +366,7 @@ class RegionManager:
             Tuple of (can_travel, reason)
         """
         try:
-            target_region = Region(target_region_id, self.data_loader)
+            target_region = self.get_region(target_region_id)
         except ValueError:
             return False, "Region not found"
         
@@ -316,7 +406,7 @@ class RegionManager:
             return False, reason
         
         try:
-            target_region = Region(target_region_id, self.data_loader)
+            target_region = self.get_region(target_region_id)
         except ValueError:
             return False, "Region not found"
         
@@ -5,7 +5,7 @@ Handles temporary modifications to entity stats and behaviors
 
 from typing import Dict, Any, Optional, Callable
 from abc import ABC, abstractmethod
-from ..enums import EffectType, EffectTarget
+from ..enums import EffectType, EffectTarget, StatType
 from ..utils.serialization import SerializableMixin
 from ..utils.string_representation import StringRepresentationMixin
 
@@ -80,8 +80,6 @@ class StatModifierEffect(Effect):
     
     def apply(self, entity) -> None:
         """Apply stat modifications to the entity"""
-        from ..entities.entity import StatType
-        
         for stat_name, modifier in self.stat_modifiers.items():
             try:
                 stat_type = StatType(stat_name)
@@ -92,8 +90,6 @@ class StatModifierEffect(Effect):
     
     def remove(self, entity) -> None:
         """Remove stat modifications from the entity"""
-        from ..entities.entity import StatType
-        
         for stat_name, modifier in self.stat_modifiers.items():
             try:
                 stat_type = StatType(stat_name)
@@ -183,11 +183,42 @@ class TestDataLoader:
         enemies = self.data_loader.list_enemies()
         assert "test_enemy" in enemies
     
+    def test_listings_cached_until_cleared(self):
+        """Test that directory listings are reused until the cache is cleared"""
+        assert "new_region" not in self.data_loader.list_regions()
+        
+        with open(os.path.join(self.temp_dir, "regions", "new_region.json"), 'w') as f:
+            json.dump({"name": "New Region"}, f)
+        assert "new_region" not in self.data_loader.list_regions()
+        
+        self.data_loader.clear_cache()
+        assert "new_region" in self.data_loader.list_regions()
+    
     def test_get_enemies_for_region(self):
         """Test getting enemies for a specific region"""
         enemies = self.data_loader.get_enemies_for_region("test_region")
         assert "test_enemy" in enemies
     
+    def test_get_enemies_for_region_cached(self):
+        """Test that region enemy lookups are cached until the cache is cleared and return copies"""
+        enemies1 = self.data_loader.get_enemies_for_region("test_region")
+        index = self.data_loader._cache["region_enemies"]
+        
+        # Callers get a copy, so changing it leaves the cached index alone
+        enemies1.append("intruder")
+        enemies2 = self.data_loader.get_enemies_for_region("test_region")
+        assert enemies2 == ["test_enemy"]
+        assert self.data_loader._cache["region_enemies"] is index
+        
+        # Unknown regions aren't added to the index
+        self.data_loader.get_enemies_for_region("nonexistent")
+        assert "nonexistent" not in index
+        
+        self.data_loader.clear_cache()
+        enemies3 = self.data_loader.get_enemies_for_region("test_region")
+        assert self.data_loader._cache["region_enemies"] is not index
+        assert enemies3 == enemies2
+    
     def test_get_enemies_for_nonexistent_region(self):
         """Test getting enemies for non-existent region"""
         enemies = self.data_loader.get_enemies_for_region("nonexistent")
@@ -203,6 +234,40 @@ class TestDataLoader:
         self.data_loader.clear_cache()
         assert self.data_loader._cache == {}
     
+    def test_reload_data_preloads_cache(self):
+        """Test that reloading data populates every cache section"""
+        self.data_loader.reload_data()
+        
+        cache = self.data_loader._cache
+        assert "test_region" in cache["regions"]
+        assert "test_activity" in cache["activities"]
+        assert "test_item" in cache["items"]
+        assert "test_enemy" in cache["enemies"]
+        assert cache["region_enemies"]["test_region"] == ["test_enemy"]
+    
+    def test_get_loaded(self):
+        """Test getting a copy of every loaded entry in a category"""
+        assert self.data_loader.get_loaded("regions") == {}
+        
+        self.data_loader.reload_data()
+        regions = self.data_loader.get_loaded("regions")
+        assert "test_region" in regions
+        
+        # Changes to the copy don't reach the cache
+        regions.clear()
+        assert "test_region" in self.data_loader.get_loaded("regions")
+    
+    def test_reload_data_swaps_cache(self):
+        """Test that reloading builds a new cache instead of emptying the live one"""
+        self.data_loader.load_region("test_region")
+        old_cache = self.data_loader._cache
+        
+        self.data_loader.reload_data()
+        
+        assert self.data_loader._cache is not old_cache
+        assert "test_region" in old_cache["regions"]
+        assert "test_region" in self.data_loader._cache["regions"]
+    
     def test_invalid_json_file(self):
         """Test handling of invalid JSON files"""
         # Create invalid JSON file
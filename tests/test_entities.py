@@ -58,6 +58,27 @@ class TestEntity:
         entity.remove_temporary_modifier(StatType.ATTACK, 3)
         assert entity.get_stat(StatType.ATTACK) == 12  # 10 base + 2 modifier
     
+    def test_get_stats(self):
+        """Test reading several stats at once"""
+        class MockEntity(Entity):
+            def _initialize_stats(self):
+                pass
+            
+            def _apply_level_up_bonuses(self):
+                pass
+        
+        entity = MockEntity("TestEntity", EntityType.PLAYER, level=1)
+        entity.set_stat(StatType.HEALTH, 100)
+        entity.add_temporary_modifier(StatType.ATTACK, 5)
+        
+        # Batched reads include temporary modifiers, like single reads
+        stats = entity.get_stats((StatType.HEALTH, StatType.ATTACK))
+        assert stats == {
+            StatType.HEALTH: entity.get_stat(StatType.HEALTH),
+            StatType.ATTACK: entity.get_stat(StatType.ATTACK),
+        }
+        assert stats == {StatType.HEALTH: 100, StatType.ATTACK: 15}
+    
     def test_damage_and_healing(self):
         """Test damage and healing mechanics"""
         class MockEntity(Entity):
@@ -243,6 +264,20 @@ class TestEnemy:
         
         # Should generate loot at least sometimes
         assert loot_generated or True  # This test might be flaky due to randomness
+    
+    def test_enemy_clone(self):
+        """Test cloning an enemy gives independent combat state"""
+        enemy = Enemy("TestEnemy", EnemyType.NORMAL, level=1, behavior=EnemyBehavior.AGGRESSIVE)
+        enemy.add_loot_item("test_item", 0.5, 2)
+        
+        clone = enemy.clone()
+        clone.take_damage(30)
+        
+        assert clone.id != enemy.id
+        assert clone.name == enemy.name
+        assert clone.loot_table == enemy.loot_table
+        assert enemy.get_stat(StatType.HEALTH) == enemy.get_stat(StatType.MAX_HEALTH)
+        assert clone.get_stat(StatType.HEALTH) < enemy.get_stat(StatType.HEALTH)
 
 
 class TestCombat:
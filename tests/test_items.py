@@ -275,6 +275,35 @@ class TestInventory:
         
         # Try to add more (should fail)
         assert inventory.add_item(item3, 1) is False
+    
+    def test_inventory_revision(self):
+        """Test the revision counter changes whenever the inventory does"""
+        inventory = Inventory()
+        
+        class MockItem:
+            def __init__(self, name, stackable=False, max_stack=1):
+                self.name = name
+                self.stackable = stackable
+                self.max_stack = max_stack
+                self.quantity = 1
+        
+        item = MockItem("Arrow", stackable=True, max_stack=99)
+        revision = inventory.revision
+        inventory.add_item(item, 5)
+        assert inventory.revision > revision
+        
+        revision = inventory.revision
+        inventory.add_item(item, 5)
+        assert inventory.revision > revision
+        
+        revision = inventory.revision
+        inventory.remove_item("Arrow", 10)
+        assert inventory.revision > revision
+        
+        # Failed operations leave it unchanged
+        revision = inventory.revision
+        inventory.remove_item("Arrow", 1)
+        assert inventory.revision == revision
 
 
 class TestEquipment:
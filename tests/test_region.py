@@ -92,6 +92,17 @@ class TestRegion:
         assert "foraging" in activities
         assert len(activities) == 3
     
+    def test_activity_display_lines(self):
+        """Test activity display lines"""
+        assert self.region.activity_display_lines == ["• Combat", "• Mining", "• Foraging"]
+        assert self.region.activity_titles["mining"] == "Mining"
+    
+    def test_has_activity(self):
+        """Test activity availability lookup"""
+        assert self.region.has_activity("mining")
+        assert self.region.has_activity("Foraging")
+        assert not self.region.has_activity("fishing")
+    
     def test_neighboring_regions(self):
         """Test neighboring regions"""
         neighbors = self.region.neighboring_regions
@@ -151,6 +162,68 @@ class TestRegion:
         assert not can_access
         assert "test_key" in reason
     
+    def test_enemy_display_lines(self):
+        """Test enemy display lines are built from region enemies and cached"""
+        os.makedirs(os.path.join(self.temp_dir, "enemies"), exist_ok=True)
+        enemy_data = {
+            "id": "test_slime",
+            "name": "Test Slime",
+            "type": "normal",
+            "base_level": 2,
+            "spawn_regions": ["test_region"]
+        }
+        with open(os.path.join(self.temp_dir, "enemies", "test_slime.json"), 'w') as f:
+            json.dump(enemy_data, f)
+        
+        lines = self.region.enemy_display_lines
+        assert lines == ["• Test Slime (Level 2)"]
+        assert self.region.enemy_display_lines is lines
+    
+    def test_get_enemies_with_discovery(self):
+        """Test enemies are annotated with the player's discovery status"""
+        os.makedirs(os.path.join(self.temp_dir, "enemies"), exist_ok=True)
+        enemy_data = {
+            "id": "test_slime",
+            "name": "Test Slime",
+            "type": "normal",
+            "base_level": 2
+        }
+        with open(os.path.join(self.temp_dir, "enemies", "test_slime.json"), 'w') as f:
+            json.dump(enemy_data, f)
+        self.region.data["enemies"] = ["test_slime", "missing_enemy"]
+        
+        player = Player("TestPlayer", PlayerClass.WARRIOR)
+        enemies = self.region.get_enemies_with_discovery(player)
+        assert len(enemies) == 1
+        assert enemies[0]["name"] == "Unknown Enemy"
+        assert not enemies[0]["discovered"]
+        
+        player.discover_enemy("test_slime")
+        enemies = self.region.get_enemies_with_discovery(player)
+        assert enemies[0]["name"] == "Test Slime"
+        assert enemies[0]["discovered"]
+        assert enemies[0]["data"] == enemy_data
+    
+    def test_get_enemy_discovery_lines(self):
+        """Test enemy lines hide undiscovered enemies"""
+        os.makedirs(os.path.join(self.temp_dir, "enemies"), exist_ok=True)
+        enemy_data = {
+            "id": "test_slime",
+            "name": "Test Slime",
+            "type": "normal",
+            "base_level": 2,
+            "emoji": "🟢"
+        }
+        with open(os.path.join(self.temp_dir, "enemies", "test_slime.json"), 'w') as f:
+            json.dump(enemy_data, f)
+        self.region.data["enemies"] = ["test_slime"]
+        
+        player = Player("TestPlayer", PlayerClass.WARRIOR)
+        assert self.region.get_enemy_discovery_lines(player) == ["❓ Unknown Enemy"]
+        
+        player.discover_enemy("test_slime")
+        assert self.region.get_enemy_discovery_lines(player) == ["🟢 Test Slime (Level 2)"]
+    
     def test_to_dict(self):
         """Test converting region to dictionary"""
         region_dict = self.region.to_dict()
@@ -213,6 +286,18 @@ class TestRegionManager:
         assert not success
         assert self.region_manager.get_current_region() is None
     
+    def test_set_current_region_reuses_region(self):
+        """Test setting the same region twice reuses the cached Region"""
+        self.region_manager.set_current_region("simple_region")
+        first = self.region_manager.get_current_region()
+        self.region_manager.set_current_region("simple_region")
+        assert self.region_manager.get_current_region() is first
+        
+        self.region_manager.clear_region_cache()
+        assert self.region_manager.get_current_region() is None
+        self.region_manager.set_current_region("simple_region")
+        assert self.region_manager.get_current_region() is not first
+    
     def test_get_current_region(self):
         """Test getting current region"""
         # Initially no region set
@@ -224,11 +309,35 @@ class TestRegionManager:
         assert current is not None
         assert current.name == "Simple Region"
     
+    def test_get_player_region(self):
+        """Test looking up a player's region leaves the current region alone"""
+        player = Player("TestPlayer", PlayerClass.WARRIOR, level=1)
+        player.current_region = "simple_region"
+        
+        region = self.region_manager.get_player_region(player)
+        assert region is self.region_manager.get_region("simple_region")
+        assert self.region_manager.get_current_region() is None
+        
+        player.current_region = "nonexistent"
+        assert self.region_manager.get_player_region(player) is None
+    
     def test_get_available_regions(self):
         """Test getting available regions"""
         regions = self.region_manager.get_available_regions()
         assert "simple_region" in regions
     
+    def test_get_accessible_regions(self):
+        """Test accessible regions are built from the cached region list"""
+        player = Player("TestPlayer", PlayerClass.WARRIOR, level=1)
+        player.current_region = "simple_region"
+        
+        regions = self.region_manager.get_accessible_regions(player)
+        assert len(regions) == 1
+        assert regions[0]["id"] == "simple_region"
+        assert regions[0]["accessible"]
+        assert regions[0]["current"]
+        assert self.region_manager.get_all_regions()[0] is self.region_manager.get_region("simple_region")
+    
     def test_can_travel_to_success(self):
         """Test successful travel check"""
         player = Player("TestPlayer", PlayerClass.WARRIOR, level=1)